@@ -0,0 +1,2 @@
+-- Index backing cursor-paginated GET /items/{id}/comments
+CREATE INDEX idx_item_comments_item_created ON item_comments(item_id, created_at, id);
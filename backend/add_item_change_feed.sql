@@ -0,0 +1,14 @@
+-- Change sequence and tombstones backing GET /items/changes
+ALTER TABLE work_items ADD COLUMN change_seq BIGINT NOT NULL DEFAULT 0;
+CREATE INDEX idx_work_items_change_seq ON work_items(change_seq, id);
+CREATE INDEX idx_work_items_branch_change_seq ON work_items(branch_id, change_seq, id);
+
+CREATE TABLE IF NOT EXISTS work_item_tombstones (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    item_id INT NOT NULL,
+    branch_id INT NULL,
+    change_seq BIGINT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_work_item_tombstones_seq (change_seq),
+    INDEX idx_work_item_tombstones_branch_seq (branch_id, change_seq)
+);
@@ -0,0 +1,10 @@
+-- Denormalized activity counters on work_items (see item_counter_service.py)
+ALTER TABLE work_items ADD COLUMN comment_count INT NOT NULL DEFAULT 0;
+ALTER TABLE work_items ADD COLUMN attachment_count INT NOT NULL DEFAULT 0;
+ALTER TABLE work_items ADD COLUMN total_logged_hours DECIMAL(10, 2) NOT NULL DEFAULT 0;
+ALTER TABLE work_items ADD COLUMN last_activity_at DATETIME NULL DEFAULT CURRENT_TIMESTAMP;
+UPDATE work_items SET last_activity_at = updated_at;
+CREATE INDEX idx_work_items_last_activity ON work_items(last_activity_at, id);
+CREATE INDEX idx_work_items_branch_last_activity ON work_items(branch_id, last_activity_at, id);
+CREATE INDEX idx_work_items_comment_count ON work_items(comment_count, id);
+CREATE INDEX idx_work_items_logged_hours ON work_items(total_logged_hours, id);
@@ -0,0 +1,3 @@
+-- Full-text indexes backing GET /items/search
+CREATE FULLTEXT INDEX ft_work_items_title_description ON work_items(title, description);
+CREATE FULLTEXT INDEX ft_item_comments_body ON item_comments(body);
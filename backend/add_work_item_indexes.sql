@@ -0,0 +1,19 @@
+-- Composite indexes for the hot work_items access paths
+-- read_items: branch scoping with status/type filters and keyset ordering
+-- (default cursor mode pages by id under the branch / assignee scope)
+CREATE INDEX idx_work_items_branch_id ON work_items(branch_id, id);
+CREATE INDEX idx_work_items_branch_status ON work_items(branch_id, status, type);
+CREATE INDEX idx_work_items_branch_updated ON work_items(branch_id, updated_at, id);
+CREATE INDEX idx_work_items_updated ON work_items(updated_at, id);
+
+-- read_items assignee_id=me, standup digests and blockers
+CREATE INDEX idx_work_items_assignee_id ON work_items(assignee_id, id);
+CREATE INDEX idx_work_items_assignee_status ON work_items(assignee_id, status, updated_at);
+CREATE INDEX idx_work_items_assignee_updated ON work_items(assignee_id, updated_at);
+
+-- get_sla_alerts and scheduler.sla_reminders
+CREATE INDEX idx_work_items_status_due ON work_items(status, due_at);
+
+-- get_weekly_report opened / closed / MTTR counts
+CREATE INDEX idx_work_items_type_created ON work_items(type, created_at);
+CREATE INDEX idx_work_items_type_status_updated ON work_items(type, status, updated_at);
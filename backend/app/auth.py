@@ -2,31 +2,89 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 import os
 from dotenv import load_dotenv
 
-from app.database import get_db
+from app.cache import TTLCache
+from app.database import get_db, get_async_db, SessionLocal
 from app.models.user import User
 from app.schemas.user import TokenData
+from app.services.token_version_service import is_token_version_current
 
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "4096"))
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__default_rounds=12)
 security = HTTPBearer()
 
+# Decoded token claims (token -> payload) and, for legacy tokens without
+# claims, resolved users (email -> CachedUser). Entries are per-process.
+token_cache = TTLCache(maxsize=AUTH_CACHE_MAX_ENTRIES, ttl=AUTH_CACHE_TTL_SECONDS)
+user_cache = TTLCache(maxsize=AUTH_CACHE_MAX_ENTRIES, ttl=AUTH_CACHE_TTL_SECONDS)
+
+class CachedUser:
+    """Detached snapshot of the authenticated user's identity fields"""
+    __slots__ = ("id", "name", "email", "role", "branch_id", "is_active", "created_at")
+
+    def __init__(self, id, name, email, role, branch_id, is_active, created_at=None):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.role = role
+        self.branch_id = branch_id
+        self.is_active = is_active
+        self.created_at = created_at
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedUser":
+        return cls(user.id, user.name, user.email, user.role, user.branch_id, user.is_active, user.created_at)
+
+    @classmethod
+    def from_claims(cls, payload: dict) -> "CachedUser":
+        return cls(
+            payload["uid"], payload.get("name"), payload["sub"], payload["role"],
+            payload.get("branch_id"), payload.get("active", True)
+        )
+
+def invalidate_user_cache(*emails: str):
+    """Drop cached users so the next request re-reads them from the database"""
+    for email in emails:
+        if email:
+            user_cache.invalidate(email)
+
+def get_auth_cache_stats() -> dict:
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+def user_token_claims(user: User, version: int) -> dict:
+    """Claims that let requests be authorized without reading the users table
+    
+    version must be read from user_token_versions in the same transaction as
+    user (see read_token_version).
+    """
+    return {
+        "sub": user.email,
+        "uid": user.id,
+        "name": user.name,
+        "role": user.role,
+        "branch_id": user.branch_id,
+        "active": bool(user.is_active),
+        "ver": version,
+    }
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -37,7 +95,26 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def _decode_token(token: str) -> dict:
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+    
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    
+    # Never cache a token past its own expiry
+    ttl = AUTH_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - datetime.now(timezone.utc).timestamp())
+    if ttl > 0:
+        token_cache.set(token, payload, ttl=ttl)
+    return payload
+
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+    return authenticate_token(db, credentials.credentials)
+
+def authenticate_token(db: Session, token: str):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -45,8 +122,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     )
     
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
@@ -54,16 +130,65 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     except JWTError:
         raise credentials_exception
     
+    # Tokens with claims are authorized from the token and the version table
+    if "uid" in payload and "ver" in payload:
+        if not is_token_version_current(payload["uid"], payload["ver"]):
+            raise credentials_exception
+        return CachedUser.from_claims(payload)
+    
+    cached = user_cache.get(token_data.email)
+    if cached is not None:
+        return cached
+    
     user = db.query(User).filter(User.email == token_data.email).first()
     if user is None:
         raise credentials_exception
-    return user
+    cached = CachedUser.from_user(user)
+    user_cache.set(token_data.email, cached)
+    return cached
 
 def get_current_active_user(current_user: User = Depends(get_current_user)):
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+async def get_current_active_user_async(credentials: HTTPAuthorizationCredentials = Depends(security), db = Depends(get_async_db)):
+    """get_current_active_user for endpoints on get_async_db; shares the request's session"""
+    user = await db.run_sync(authenticate_token, credentials.credentials)
+    return get_current_active_user(user)
+
+def get_stream_user(request: Request, token: Optional[str] = Query(None)):
+    """Authenticate a long-lived stream without holding a database session
+    
+    EventSource cannot send headers, so the token may also come as ?token=.
+    The token is kept on request.state so the stream can re-check it.
+    """
+    authorization = request.headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    
+    user = _authenticate_stream_token(token)
+    request.state.stream_token = token
+    return user
+
+def _authenticate_stream_token(token: str):
+    db = SessionLocal()
+    try:
+        user = authenticate_token(db, token)
+    finally:
+        db.close()
+    return get_current_active_user(user)
+
+def stream_token_valid(token: str) -> bool:
+    """Whether an open stream's token still holds: not expired, revoked or deactivated"""
+    try:
+        _authenticate_stream_token(token)
+    except HTTPException:
+        return False
+    return True
+
 def require_pm_role(current_user: User = Depends(get_current_active_user)):
     if current_user.role != "pm":
         raise HTTPException(
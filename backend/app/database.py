@@ -1,7 +1,8 @@
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+from starlette.concurrency import run_in_threadpool
 import os
 from dotenv import load_dotenv
 
@@ -26,6 +27,36 @@ else:
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional async engine for the hot read endpoints (see get_async_db).
+# The URL defaults to DATABASE_URL with the async twin of its driver.
+USE_ASYNC_DB = os.getenv("USE_ASYNC_DB", "false").lower() == "true"
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or (
+    DATABASE_URL.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+    .replace("sqlite://", "sqlite+aiosqlite://", 1)
+)
+
+async_engine = None
+AsyncSessionLocal = None
+if USE_ASYNC_DB:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    
+    if "sqlite" in ASYNC_DATABASE_URL:
+        # In-memory databases must share one connection; files get one per session
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            poolclass=StaticPool if ":memory:" in ASYNC_DATABASE_URL else NullPool,
+        )
+    else:
+        # One connection per in-flight request instead of one per thread
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_pre_ping=True,
+            pool_recycle=280,
+            pool_size=int(os.getenv("ASYNC_DB_POOL_SIZE", "20")),
+            max_overflow=int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "20")),
+        )
+    AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -35,6 +66,30 @@ def get_db():
     finally:
         db.close()
 
+class ThreadpoolSession:
+    """Stand-in for AsyncSession when USE_ASYNC_DB is off
+    
+    run_sync() runs the function with a regular Session on the threadpool,
+    so endpoints written against get_async_db work in both modes.
+    """
+    
+    def __init__(self):
+        self.session = SessionLocal()
+    
+    async def run_sync(self, fn, *args, **kwargs):
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+    
+    async def close(self):
+        await run_in_threadpool(self.session.close)
+
+async def get_async_db():
+    """Async counterpart of get_db; call sync query code through await db.run_sync(fn, ...)"""
+    db = AsyncSessionLocal() if USE_ASYNC_DB else ThreadpoolSession()
+    try:
+        yield db
+    finally:
+        await db.close()
+
 def init_db():
     # Import all models here to ensure they are registered
     from app.models import user, work_item, item_comment, oncall_roster, project, branch
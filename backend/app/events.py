@@ -0,0 +1,181 @@
+from threading import Lock
+from typing import Any, Optional, Set
+import asyncio
+import json
+import logging
+import os
+
+from app.schemas.work_item import WorkItem as WorkItemSchema
+from app.streaming import json_default
+
+logger = logging.getLogger(__name__)
+
+# local: events reach clients connected to this process only
+# redis: events go through a Redis channel shared by every uvicorn worker
+EVENT_BACKEND = os.getenv("EVENT_BACKEND", "local")
+EVENT_REDIS_URL = os.getenv("EVENT_REDIS_URL", "redis://localhost:6379/0")
+EVENT_CHANNEL = os.getenv("EVENT_CHANNEL", "itsupport:events")
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "100"))
+
+class Subscriber:
+    """One connected client: its identity for filtering and its event queue"""
+
+    def __init__(self, user):
+        self.user_id = user.id
+        self.role = user.role
+        self.branch_id = user.branch_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self.closed = False
+
+    def wants(self, event: dict) -> bool:
+        """Apply the read_items / notification visibility rules to an event"""
+        audience = event.get("audience", {})
+        if "user_id" in audience:
+            return audience["user_id"] == self.user_id
+        if self.role == "pm":
+            return True
+        if self.role == "dev" and (self.branch_id is None or audience.get("assignee_id") == self.user_id):
+            return True
+        return audience.get("branch_id") == self.branch_id
+
+class LocalEventBackend:
+    """Deliver published events straight to this process's subscribers"""
+
+    def __init__(self, hub: "EventHub"):
+        self.hub = hub
+
+    def start(self):
+        pass
+
+    def publish(self, event: dict):
+        self.hub.dispatch(event)
+
+    def stop(self):
+        pass
+
+class RedisEventBackend:
+    """Share events between workers through a Redis pub/sub channel"""
+
+    def __init__(self, hub: "EventHub", url: str = EVENT_REDIS_URL, channel: str = EVENT_CHANNEL):
+        import redis
+
+        self.hub = hub
+        self.channel = channel
+        self.client = redis.Redis.from_url(url)
+        self._pubsub = None
+
+    def start(self):
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: self._on_message})
+        self._thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def _on_message(self, message):
+        try:
+            self.hub.dispatch(json.loads(message["data"]))
+        except ValueError:
+            logger.warning("Dropped malformed event from Redis")
+
+    def publish(self, event: dict):
+        self.client.publish(self.channel, json.dumps(event, default=json_default))
+
+    def stop(self):
+        if self._pubsub is not None:
+            self._thread.stop()
+            self._pubsub.close()
+
+class EventHub:
+    """In-process pub/sub fanning events out to connected SSE clients
+
+    publish() is safe to call from the sync route handlers running in the
+    threadpool; delivery always happens on the event loop that owns the
+    subscriber queues.
+    """
+
+    def __init__(self):
+        self._subscribers: Set[Subscriber] = set()
+        self._lock = Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.backend = LocalEventBackend(self)
+
+    def start(self, backend_name: str = EVENT_BACKEND):
+        self._loop = asyncio.get_running_loop()
+        self.backend = RedisEventBackend(self) if backend_name == "redis" else LocalEventBackend(self)
+        self.backend.start()
+        logger.info(f"Event hub started with the {backend_name} backend")
+
+    def stop(self):
+        self.backend.stop()
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            self._close(subscriber)
+
+    def subscribe(self, user) -> Subscriber:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        subscriber = Subscriber(user)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event_type: str, data: Any, **audience):
+        """Publish an event; audience is user_id=... or branch_id=/assignee_id=..."""
+        event = {"type": event_type, "data": data, "audience": audience}
+        try:
+            self.backend.publish(event)
+        except Exception as e:
+            # Live updates are best effort; never fail the write that triggered them
+            logger.error(f"Failed to publish {event_type} event: {e}")
+
+    def dispatch(self, event: dict):
+        """Hand an event to the event loop for fan-out (callable from any thread)"""
+        if self._loop is None or self._loop.is_closed() or not self._subscribers:
+            return
+        self._loop.call_soon_threadsafe(self._fan_out, event)
+
+    def _fan_out(self, event: dict):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if subscriber.closed or not subscriber.wants(event):
+                continue
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Drop clients that stopped reading; they resync on reconnect
+                logger.warning(f"Disconnecting slow event subscriber for user {subscriber.user_id}")
+                self._close(subscriber)
+
+    def _close(self, subscriber: Subscriber):
+        subscriber.closed = True
+        self.unsubscribe(subscriber)
+        # Wake the stream so it can end; None marks the end of the queue
+        while True:
+            try:
+                subscriber.queue.put_nowait(None)
+                break
+            except asyncio.QueueFull:
+                subscriber.queue.get_nowait()
+
+event_hub = EventHub()
+
+def publish_item_event(event_type: str, item):
+    """Push a work item change to every client allowed to see the item"""
+    event_hub.publish(
+        event_type,
+        {"item": WorkItemSchema.model_validate(item).model_dump(mode="json"), "change_seq": item.change_seq},
+        branch_id=item.branch_id,
+        assignee_id=item.assignee_id
+    )
+
+def publish_notification_event(notification: dict):
+    """Push a new in-app notification to its recipient"""
+    event_hub.publish("notification.created", notification, user_id=notification["user_id"])
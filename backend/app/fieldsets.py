@@ -0,0 +1,47 @@
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter, create_model
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel], always: Sequence[str] = ("id",)) -> Optional[Tuple[str, ...]]:
+    """Parse a comma-separated fields= parameter against a response schema"""
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in schema.model_fields]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    # Keep schema order so equal field sets share one sparse model
+    selected = set(requested) | set(always)
+    return tuple(name for name in schema.model_fields if name in selected)
+
+@lru_cache(maxsize=256)
+def sparse_model(schema: Type[BaseModel], field_names: Tuple[str, ...]) -> Type[BaseModel]:
+    """A copy of schema restricted to field_names"""
+    definitions = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name])
+        for name in field_names
+    }
+    return create_model(f"{schema.__name__}Fields", **definitions)
+
+@lru_cache(maxsize=256)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+def sparse_columns(table_model, field_names: Iterable[str]) -> list:
+    """Mapped columns for the requested fields that exist on the table"""
+    table = table_model.__table__
+    return [getattr(table_model, name) for name in field_names if name in table.c]
+
+def sparse_response(schema: Type[BaseModel], field_names: Tuple[str, ...], rows: List[dict]) -> Response:
+    """Validate rows against the sparse schema and serialize them in one pass"""
+    adapter = _list_adapter(sparse_model(schema, field_names))
+    return Response(content=adapter.dump_json(adapter.validate_python(rows)), media_type="application/json")
+
+def sparse_page_response(schema: Type[BaseModel], field_names: Tuple[str, ...], rows: List[dict], next_cursor: Optional[str]) -> Response:
+    """Cursor-mode variant of sparse_response returning {items, next_cursor}"""
+    adapter = _list_adapter(sparse_model(schema, field_names))
+    items = adapter.dump_python(adapter.validate_python(rows), mode="json")
+    return JSONResponse({"items": items, "next_cursor": next_cursor})
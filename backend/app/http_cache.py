@@ -0,0 +1,31 @@
+from fastapi import Request, Response
+from typing import Any, Optional
+import hashlib
+
+CACHE_CONTROL = "private, no-cache"
+
+def make_etag(request: Request, current_user: Any, *fingerprint: Any) -> str:
+    """Strong ETag for a response that depends on the caller, the URL and a data fingerprint"""
+    key = "|".join(str(part) for part in (
+        request.url.path,
+        request.url.query,
+        request.headers.get("accept", ""),
+        current_user.id,
+        current_user.role,
+        current_user.branch_id,
+        *fingerprint
+    ))
+    return '"' + hashlib.sha1(key.encode()).hexdigest() + '"'
+
+def set_etag(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Return a 304 if the client already holds this ETag, else tag the response"""
+    set_etag(response, etag)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]):
+        return set_etag(Response(status_code=304), etag)
+    return None
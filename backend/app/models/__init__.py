@@ -1,2 +1,2 @@
-from . import user, work_item, item_comment, oncall_roster, project, branch, time_entry, activity_report, notification, attachment
+from . import user, work_item, item_comment, oncall_roster, project, branch, time_entry, activity_report, notification, attachment, token_version, table_version, work_item_tombstone, notification_outbox, notification_unread_count, notification_archive
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Index, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -15,3 +15,15 @@ class ItemComment(Base):
     # Relationships
     work_item = relationship("WorkItem", back_populates="comments")
     user = relationship("User", back_populates="comments")
+    
+    # Comment pages seek by (created_at, id) within one item (see add_comment_indexes.sql)
+    __table_args__ = (
+        Index('idx_item_comments_item_created', 'item_id', 'created_at', 'id'),
+    )
+
+# Full-text index for /items/search (MySQL only; other databases fall back to LIKE)
+event.listen(
+    ItemComment.__table__,
+    "after_create",
+    DDL("CREATE FULLTEXT INDEX ft_item_comments_body ON item_comments(body)").execute_if(dialect="mysql")
+)
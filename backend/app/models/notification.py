@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -40,6 +40,11 @@ class Notification(Base):
     user = relationship("User", foreign_keys=[user_id], backref="notifications")
     ticket = relationship("WorkItem", backref="notifications")
     related_user = relationship("User", foreign_keys=[related_user_id])
+    
+    __table_args__ = (
+        # Lets the retention job find old read notifications without a scan
+        Index('idx_notifications_read_created', 'is_read', 'created_at', 'id'),
+    )
 
 
 class NotificationPreference(Base):
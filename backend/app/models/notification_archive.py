@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy.sql import func
+from app.database import Base
+
+class NotificationArchive(Base):
+    __tablename__ = "notifications_archive"
+    
+    # Read notifications moved out of the live table by the retention job
+    # (see notification_retention_service.py). No foreign keys, so archived
+    # rows outlive deleted users and tickets.
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False, index=True)
+    type = Column(String(32), nullable=False)
+    title = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+    ticket_id = Column(Integer, nullable=True)
+    related_user_id = Column(Integer, nullable=True)
+    is_read = Column(Boolean, default=True)
+    read_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class NotificationOutbox(Base):
+    __tablename__ = "notification_outbox"
+    
+    # One pending delivery, written in the same transaction as the change that
+    # triggered it and drained by the outbox worker
+    id = Column(Integer, primary_key=True, index=True)
+    channel = Column(String(16), nullable=False)  # in_app, email or slack
+    payload = Column(JSON, nullable=False)
+    
+    # Rows are deleted once delivered; failed ones stay for inspection
+    status = Column(String(16), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False)
+    last_error = Column(Text, nullable=True)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index('idx_notification_outbox_pending', 'status', 'next_attempt_at', 'id'),
+    )
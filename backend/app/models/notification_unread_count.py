@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+class NotificationUnreadCount(Base):
+    __tablename__ = "notification_unread_counts"
+    
+    # Maintained with every notification insert / read / delete so
+    # GET /notifications/unread-count is a primary key lookup; the nightly
+    # reconciliation job corrects any drift
+    user_id = Column(Integer, primary_key=True)
+    unread_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
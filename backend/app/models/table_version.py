@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+class TableVersion(Base):
+    __tablename__ = "table_versions"
+    
+    # Bumped in the same transaction as every write to the named table;
+    # list endpoints derive their ETags from it
+    table_name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
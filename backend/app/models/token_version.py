@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.database import Base
+
+class UserTokenVersion(Base):
+    __tablename__ = "user_token_versions"
+    
+    # Tokens carry the version they were issued with; bumping it revokes them
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
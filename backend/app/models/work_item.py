@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Numeric
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, ForeignKey, Enum, Numeric, Index, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -30,6 +30,15 @@ class WorkItem(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    # Activity counters, maintained by item_counter_service and repaired nightly
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    attachment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_logged_hours = Column(Numeric(10, 2), nullable=False, default=0, server_default="0")
+    last_activity_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Value of the work_items table version at the item's last write (GET /items/changes)
+    change_seq = Column(BigInteger, nullable=False, default=0, server_default="0")
+    
     # Relationships
     project = relationship("Project", back_populates="work_items")
     branch = relationship("Branch", back_populates="work_items")
@@ -37,3 +46,31 @@ class WorkItem(Base):
     assignee = relationship("User", foreign_keys=[assignee_id], back_populates="assigned_items")
     comments = relationship("ItemComment", back_populates="work_item", cascade="all, delete-orphan")
     time_entries = relationship("TimeEntry", back_populates="work_item", cascade="all, delete-orphan")
+    
+    # Composite indexes matching the list, report and scheduler filters
+    # (see add_work_item_indexes.sql and check_query_plans.py)
+    __table_args__ = (
+        Index('idx_work_items_branch_id', 'branch_id', 'id'),
+        Index('idx_work_items_branch_status', 'branch_id', 'status', 'type'),
+        Index('idx_work_items_branch_updated', 'branch_id', 'updated_at', 'id'),
+        Index('idx_work_items_updated', 'updated_at', 'id'),
+        Index('idx_work_items_assignee_id', 'assignee_id', 'id'),
+        Index('idx_work_items_assignee_status', 'assignee_id', 'status', 'updated_at'),
+        Index('idx_work_items_assignee_updated', 'assignee_id', 'updated_at'),
+        Index('idx_work_items_status_due', 'status', 'due_at'),
+        Index('idx_work_items_type_created', 'type', 'created_at'),
+        Index('idx_work_items_type_status_updated', 'type', 'status', 'updated_at'),
+        Index('idx_work_items_change_seq', 'change_seq', 'id'),
+        Index('idx_work_items_branch_change_seq', 'branch_id', 'change_seq', 'id'),
+        Index('idx_work_items_last_activity', 'last_activity_at', 'id'),
+        Index('idx_work_items_branch_last_activity', 'branch_id', 'last_activity_at', 'id'),
+        Index('idx_work_items_comment_count', 'comment_count', 'id'),
+        Index('idx_work_items_logged_hours', 'total_logged_hours', 'id'),
+    )
+
+# Full-text index for /items/search (MySQL only; other databases fall back to LIKE)
+event.listen(
+    WorkItem.__table__,
+    "after_create",
+    DDL("CREATE FULLTEXT INDEX ft_work_items_title_description ON work_items(title, description)").execute_if(dialect="mysql")
+)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class WorkItemTombstone(Base):
+    __tablename__ = "work_item_tombstones"
+    
+    # Written when an item leaves a branch (or is deleted) so GET /items/changes
+    # can tell clients scoped to that branch to drop it
+    id = Column(Integer, primary_key=True, index=True)
+    item_id = Column(Integer, nullable=False)
+    branch_id = Column(Integer, nullable=True)
+    change_seq = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index('idx_work_item_tombstones_seq', 'change_seq'),
+        Index('idx_work_item_tombstones_branch_seq', 'branch_id', 'change_seq'),
+    )
@@ -9,6 +9,10 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+def email_configured() -> bool:
+    """Whether SMTP settings are present, i.e. send_email can succeed at all"""
+    return all([os.getenv("SMTP_HOST"), os.getenv("SMTP_USERNAME"), os.getenv("SMTP_PASSWORD")])
+
 def send_email(to_email: str, subject: str, body: str):
     """Send email notification"""
     try:
@@ -0,0 +1,68 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+import logging
+import os
+import threading
+
+from app.database import SessionLocal
+from app.services.notification_outbox_service import drain_outbox
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on delivery delay when no commit in this process wakes the worker
+# (e.g. rows queued by another uvicorn worker, or retries coming due)
+OUTBOX_POLL_SECONDS = float(os.getenv("NOTIFICATION_OUTBOX_POLL_SECONDS", "2"))
+
+class OutboxWorker:
+    """Background thread draining notification_outbox off the request path"""
+
+    def __init__(self):
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="notification-outbox", daemon=True)
+        self._thread.start()
+        logger.info("Notification outbox worker started")
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def wake(self):
+        self._wake.set()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wake.wait(OUTBOX_POLL_SECONDS)
+            self._wake.clear()
+            self.drain()
+
+    def drain(self):
+        """Process the outbox until nothing is due"""
+        db = SessionLocal()
+        try:
+            while not self._stopping.is_set() and drain_outbox(db):
+                pass
+        except Exception as e:
+            logger.error(f"Notification outbox worker error: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+outbox_worker = OutboxWorker()
+
+@event.listens_for(Session, "after_commit")
+def _wake_after_commit(session):
+    # enqueue_notification flags the session; start draining once its rows are visible
+    if session.info.pop("notification_outbox", False):
+        outbox_worker.wake()
+
+@event.listens_for(Session, "after_rollback")
+def _forget_after_rollback(session):
+    session.info.pop("notification_outbox", None)
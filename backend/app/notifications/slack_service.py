@@ -7,6 +7,10 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+def slack_configured() -> bool:
+    """Whether a Slack webhook is configured"""
+    return bool(os.getenv("SLACK_WEBHOOK_URL"))
+
 def send_slack_message(text: str, channel: str = None):
     """Send Slack notification via webhook"""
     try:
@@ -0,0 +1,36 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, Optional
+import base64
+import json
+
+from fastapi import HTTPException
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    key = [
+        value.isoformat() if isinstance(value, datetime) else str(value) if isinstance(value, Decimal) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, *types: type) -> List[Any]:
+    """Decode a cursor produced by encode_cursor, converting each value to the given type"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(key, list) or len(key) != len(types):
+            raise ValueError("cursor has the wrong shape")
+        return [
+            datetime.fromisoformat(value) if type_ is datetime else type_(value)
+            for value, type_ in zip(key, types)
+        ]
+    except (ValueError, TypeError, ArithmeticError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def next_cursor_for(rows: list, limit: int, *columns: str) -> Optional[str]:
+    """Cursor for the page after rows, which were fetched with limit + 1"""
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(*(getattr(last, column) for column in columns))
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, select
 from typing import List, Optional
 from datetime import datetime, date, time as time_type
 
@@ -14,6 +14,8 @@ from app.schemas.activity_report import (
     ActivityReportWithUser
 )
 from app.auth import get_current_active_user
+from app.fieldsets import parse_fields, sparse_columns, sparse_response
+from app.rows import read_rows
 
 router = APIRouter()
 
@@ -71,6 +73,7 @@ def read_activity_reports(
     user_id: Optional[int] = Query(None),
     date_from: Optional[date] = Query(None),
     date_to: Optional[date] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of report fields to return"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -92,7 +95,15 @@ def read_activity_reports(
     if date_to:
         query = query.filter(ActivityReport.date <= date_to)
     
-    reports = query.order_by(ActivityReport.date.desc(), ActivityReport.created_at.desc()).offset(skip).limit(limit).all()
+    query = query.order_by(ActivityReport.date.desc(), ActivityReport.created_at.desc()).offset(skip).limit(limit)
+    
+    # Sparse fieldsets select only the requested columns
+    field_names = parse_fields(fields, ActivityReportSchema)
+    if field_names:
+        rows = query.with_entities(*sparse_columns(ActivityReport, field_names)).all()
+        return sparse_response(ActivityReportSchema, field_names, [row._asdict() for row in rows])
+    
+    reports = query.all()
     return reports
 
 @router.get("/summary")
@@ -104,22 +115,23 @@ def get_activity_summary(
     current_user: User = Depends(get_current_active_user)
 ):
     """Get summary of activity reports"""
-    query = db.query(ActivityReport)
+    # Only three columns are needed; read them as plain rows through Core
+    query = select(ActivityReport.hours_worked, ActivityReport.activity_type, ActivityReport.date)
     
     # Role-based filtering
     if current_user.role == "pm":
         if user_id:
-            query = query.filter(ActivityReport.user_id == user_id)
+            query = query.where(ActivityReport.user_id == user_id)
     else:
-        query = query.filter(ActivityReport.user_id == current_user.id)
+        query = query.where(ActivityReport.user_id == current_user.id)
     
     # Date filtering
     if date_from:
-        query = query.filter(ActivityReport.date >= date_from)
+        query = query.where(ActivityReport.date >= date_from)
     if date_to:
-        query = query.filter(ActivityReport.date <= date_to)
+        query = query.where(ActivityReport.date <= date_to)
     
-    reports = query.all()
+    reports = read_rows(db, query)
     
     # Calculate summary
     total_minutes = sum(r.hours_worked for r in reports)
@@ -12,6 +12,7 @@ from app.models.attachment import Attachment
 from app.models.work_item import WorkItem
 from app.schemas.attachment import Attachment as AttachmentSchema
 from app.auth import get_current_active_user
+from app.services.item_counter_service import bump_item_counters
 
 router = APIRouter()
 
@@ -52,6 +53,7 @@ async def upload_attachment(
         f.write(file_content)
     
     # Create database record
+    bump_item_counters(db, item_id, attachments=1)
     attachment = Attachment(
         work_item_id=item_id,
         filename=unique_filename,
@@ -138,6 +140,7 @@ def delete_attachment(
     
     # Delete database record
     db.delete(attachment)
+    bump_item_counters(db, attachment.work_item_id, attachments=-1)
     db.commit()
     
     return {"message": "Attachment deleted successfully"}
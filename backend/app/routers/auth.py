@@ -1,17 +1,21 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.user import User
-from app.models.branch import Branch
 from app.schemas.user import UserCreate, User as UserSchema, Token
 from app.auth import (
-    verify_password, get_password_hash, create_access_token,
-    get_current_active_user, require_pm_role,
+    create_access_token, user_token_claims,
+    get_current_active_user_async, require_pm_role, get_auth_cache_stats,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
+from app.services.table_version_service import bump_table_version
+from app.services.token_version_service import read_token_version
+from app.services.password_service import hash_password, verify_password_async, login_throttle
 
 router = APIRouter()
 
@@ -26,7 +30,7 @@ def signup(user: UserCreate, db: Session = Depends(get_db), current_user: User =
         )
     
     # Create new user
-    hashed_password = get_password_hash(user.password)
+    hashed_password = hash_password(user.password)
     db_user = User(
         name=user.name,
         email=user.email,
@@ -34,50 +38,53 @@ def signup(user: UserCreate, db: Session = Depends(get_db), current_user: User =
         role=user.role
     )
     db.add(db_user)
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(db_user)
     return db_user
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    account = form_data.username.lower()
+    retry_after = login_throttle.retry_after(account)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts. Try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+    
+    # Only the lookup uses a request thread; bcrypt runs in the password pool.
+    # The token version is read in the same transaction as the user, so the
+    # role and version in the token always match.
+    def lookup():
+        user = db.query(User).filter(User.email == form_data.username).first()
+        return user, read_token_version(db, user.id) if user else 0
+    user, token_version = await run_in_threadpool(lookup)
+    if not user or not await verify_password_async(form_data.password, user.password_hash):
+        login_throttle.record_failure(account)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    login_throttle.reset(account)
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    claims = user_token_claims(user, token_version)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=claims, expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/me", response_model=UserSchema)
-def read_users_me(current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
-    # Reload user with branch relationship
-    user_with_branch = db.query(User).filter(User.id == current_user.id).first()
-    
-    # Convert to dict and add branch info
-    user_dict = {
-        "id": user_with_branch.id,
-        "name": user_with_branch.name,
-        "email": user_with_branch.email,
-        "role": user_with_branch.role,
-        "branch_id": user_with_branch.branch_id,
-        "is_active": user_with_branch.is_active,
-        "created_at": user_with_branch.created_at,
-        "branch": None
-    }
-    
-    # Add branch information if available
-    if user_with_branch.branch_id:
-        branch = db.query(Branch).filter(Branch.id == user_with_branch.branch_id).first()
-        if branch:
-            user_dict["branch"] = {
-                "id": branch.id,
-                "name": branch.name
-            }
-    
-    return user_dict
+async def read_users_me(current_user: User = Depends(get_current_active_user_async), db: AsyncSession = Depends(get_async_db)):
+    # Load the user and their branch in one query
+    return await db.run_sync(
+        lambda session: session.query(User).options(joinedload(User.branch)).filter(User.id == current_user.id).first()
+    )
+
+@router.get("/cache-stats")
+def read_auth_cache_stats(current_user: User = Depends(require_pm_role)):
+    """Get hit/miss counters for the authentication cache (PM only)"""
+    return get_auth_cache_stats()
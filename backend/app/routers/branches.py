@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -7,6 +7,8 @@ from app.models.branch import Branch
 from app.models.user import User
 from app.schemas.branch import Branch as BranchSchema, BranchCreate
 from app.auth import get_current_active_user, require_pm_role
+from app.services.table_version_service import bump_table_version, get_table_versions
+from app.http_cache import make_etag, not_modified
 
 router = APIRouter()
 
@@ -15,6 +17,8 @@ router = APIRouter()
 def read_branches(
     skip: int = 0, 
     limit: int = 100, 
+    request: Request = None,
+    response: Response = None,
     db: Session = Depends(get_db), 
     current_user: User = Depends(get_current_active_user)
 ):
@@ -22,6 +26,11 @@ def read_branches(
     if current_user.role != "pm":
         raise HTTPException(status_code=403, detail="PM role required")
     
+    etag = make_etag(request, current_user, *get_table_versions(db, "branches"))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+    
     branches = db.query(Branch).offset(skip).limit(limit).all()
     return branches
 
@@ -44,6 +53,7 @@ def create_branch(
     # Create new branch
     db_branch = Branch(name=branch.name)
     db.add(db_branch)
+    bump_table_version(db, "branches")
     db.commit()
     db.refresh(db_branch)
     return db_branch
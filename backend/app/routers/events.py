@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+import asyncio
+import json
+import os
+import time
+
+from app.auth import get_stream_user, stream_token_valid
+from app.events import event_hub
+from app.models.user import User
+from app.streaming import json_default
+
+router = APIRouter()
+
+# Comment lines keep idle connections open through proxies; the stream's
+# token is re-checked at the same interval
+EVENT_HEARTBEAT_SECONDS = float(os.getenv("EVENT_HEARTBEAT_SECONDS", "25"))
+
+HEARTBEAT = object()
+
+@router.get("/stream")
+async def stream_events(request: Request, current_user: User = Depends(get_stream_user)):
+    """Server-Sent Events feed of item changes and new notifications for the current user"""
+    token = request.state.stream_token
+    subscriber = event_hub.subscribe(current_user)
+    
+    async def event_source():
+        checked_at = time.monotonic()
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), timeout=EVENT_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    event = HEARTBEAT
+                if event is None:
+                    break
+                # Expired, revoked (role change, deactivation) or logged-out
+                # tokens end the stream; the client reconnects with a new one
+                if time.monotonic() - checked_at >= EVENT_HEARTBEAT_SECONDS:
+                    if not await run_in_threadpool(stream_token_valid, token):
+                        yield "event: auth.expired\ndata: {}\n\n"
+                        break
+                    checked_at = time.monotonic()
+                if event is HEARTBEAT:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event['data'], default=json_default)}\n\n"
+        finally:
+            event_hub.unsubscribe(subscriber)
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,16 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from typing import List, Optional
-from datetime import datetime, date, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse, FileResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, tuple_, func
+from typing import List, Optional, Union
+from datetime import datetime, date, timedelta, timezone
+from decimal import Decimal
+import os
+import tempfile
 
-from app.database import get_db
+from app.database import get_db, get_async_db, SessionLocal
+from app.pagination import decode_cursor, encode_cursor, next_cursor_for
+from app.streaming import ndjson_chunks, STREAM_BATCH_SIZE
+from app.fieldsets import parse_fields, sparse_columns, sparse_response, sparse_page_response
 from app.models.user import User
 from app.models.work_item import WorkItem
 from app.models.item_comment import ItemComment
-from app.schemas.work_item import WorkItem as WorkItemSchema, WorkItemCreate, WorkItemUpdate, WorkItemWithComments, WorkItemAssign
-from app.schemas.work_item import CommentCreate, Comment
-from app.auth import get_current_active_user
+from app.models.branch import Branch
+from app.models.work_item_tombstone import WorkItemTombstone
+from app.schemas.work_item import WorkItem as WorkItemSchema, WorkItemCreate, WorkItemUpdate, WorkItemWithComments, WorkItemAssign, WorkItemPage, WorkItemChanges, WorkItemBundle, WorkItemBulkUpdate, WorkItemBulkResult, WorkItemStats, WorkItemSearchHit
+from app.schemas.work_item import CommentCreate, Comment, CommentWithAuthor, CommentPage
+from app.auth import get_current_active_user, get_current_active_user_async
+from app.services.time_tracking_service import calculate_ticket_time_stats
+from app.services.search_service import search_scores
+from app.services.table_version_service import bump_table_version, get_table_versions
+from app.services.item_change_service import next_change_seq, record_item_removal
+from app.services.item_counter_service import bump_item_counters
+from app.http_cache import make_etag, not_modified, set_etag
+from app.serialization import fast_response, serialize_rows
+from app.rows import read_rows, schema_columns
+from app.events import event_hub, publish_item_event
+from app.services.export_service import export_columns, stream_export_rows, group_tickets, csv_chunks, write_xlsx
 from app.services.notification_service import (
     notify_ticket_assigned,
     notify_ticket_commented,
@@ -44,31 +65,34 @@ def create_item(item: WorkItemCreate, db: Session = Depends(get_db), current_use
         start_date=item.start_date,
         end_date=item.end_date,
         due_at=item.due_at,
-        sla_hours=item.sla_hours
+        sla_hours=item.sla_hours,
+        change_seq=next_change_seq(db)
     )
     db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
     
-    # Send notification if assigned
+    # Queue the notification in the same transaction as the item
     if item.assignee_id:
+        db.flush()
         notify_ticket_assigned(db, db_item.id, item.assignee_id, current_user.id)
     
+    db.commit()
+    db.refresh(db_item)
+    publish_item_event("item.created", db_item)
+    
     return db_item
 
-@router.get("/", response_model=List[WorkItemSchema])
-@router.get("", response_model=List[WorkItemSchema])
-def read_items(
-    skip: int = 0,
-    limit: int = Query(default=5000, le=10000),
-    type: Optional[str] = Query(None),
-    status: Optional[str] = Query(None),
-    assignee_id: Optional[str] = Query(None),
-    branch_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+def scoped_items_query(
+    db: Session,
+    current_user: User,
+    type: Optional[str] = None,
+    status: Optional[str] = None,
+    assignee_id: Optional[str] = None,
+    branch_id: Optional[int] = None,
+    query=None
 ):
-    query = db.query(WorkItem)
+    """Apply the role-based branch scoping and list filters used by read_items"""
+    if query is None:
+        query = db.query(WorkItem)
     
     # Branch filtering based on user role
     # Note: When developers request their own assignments (assignee_id == "me"),
@@ -103,17 +127,485 @@ def read_items(
                 # If not a valid integer, ignore the filter
                 pass
     
-    items = query.offset(skip).limit(limit).all()
-    return items
+    return query
+
+# Sort keys read_items accepts besides id, with the type their cursors decode to;
+# each is backed by a (column, id) index
+SORT_COLUMNS = {
+    "updated_at": datetime,
+    "last_activity_at": datetime,
+    "comment_count": int,
+    "total_logged_hours": Decimal,
+}
+
+def apply_sort(query, order_by: str):
+    """Order newest / largest first by (order_by, id) or by id alone"""
+    if order_by in SORT_COLUMNS:
+        return query.order_by(getattr(WorkItem, order_by).desc(), WorkItem.id.desc())
+    return query.order_by(WorkItem.id.desc())
+
+def apply_keyset_page(query, order_by: str, cursor: Optional[str], limit: int):
+    """Sort as apply_sort does and seek past the cursor"""
+    if cursor:
+        if order_by in SORT_COLUMNS:
+            value, last_id = decode_cursor(cursor, SORT_COLUMNS[order_by], int)
+            query = query.filter(tuple_(getattr(WorkItem, order_by), WorkItem.id) < tuple_(value, last_id))
+        else:
+            last_id, = decode_cursor(cursor, int)
+            query = query.filter(WorkItem.id < last_id)
+    
+    # Fetch one extra row to know whether another page exists
+    return apply_sort(query, order_by).limit(limit + 1)
+
+def keyset_columns(order_by: str):
+    return (order_by, "id") if order_by in SORT_COLUMNS else ("id",)
+
+@router.get("/", response_model=Union[List[WorkItemSchema], WorkItemPage])
+@router.get("", response_model=Union[List[WorkItemSchema], WorkItemPage])
+async def read_items(
+    skip: int = 0,
+    limit: int = Query(default=5000, le=10000),
+    type: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    assignee_id: Optional[str] = Query(None),
+    branch_id: Optional[int] = Query(None),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+    cursor: Optional[str] = Query(None),
+    order_by: str = Query("id", pattern="^(id|updated_at|last_activity_at|comment_count|total_logged_hours)$"),
+    min_comments: Optional[int] = Query(None, ge=0),
+    has_attachments: Optional[bool] = Query(None),
+    active_since: Optional[datetime] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of item fields to return"),
+    request: Request = None,
+    response: Response = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    return await db.run_sync(
+        list_items, current_user, request, response,
+        skip=skip, limit=limit, type=type, status=status, assignee_id=assignee_id, branch_id=branch_id,
+        pagination=pagination, cursor=cursor, order_by=order_by, min_comments=min_comments,
+        has_attachments=has_attachments, active_since=active_since, fields=fields
+    )
+
+def list_items(
+    db: Session,
+    current_user: User,
+    request: Request,
+    response: Response,
+    skip: int,
+    limit: int,
+    type: Optional[str],
+    status: Optional[str],
+    assignee_id: Optional[str],
+    branch_id: Optional[int],
+    pagination: str,
+    cursor: Optional[str],
+    order_by: str,
+    min_comments: Optional[int],
+    has_attachments: Optional[bool],
+    active_since: Optional[datetime],
+    fields: Optional[str]
+):
+    """Body of read_items, run with a sync Session (see get_async_db)"""
+    # Answer revalidations from the table version without building the list
+    etag = make_etag(request, current_user, *get_table_versions(db, "work_items"))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+    
+    query = scoped_items_query(db, current_user, type, status, assignee_id, branch_id)
+    
+    # Activity filters read the maintained counters, not the child tables
+    if min_comments is not None:
+        query = query.filter(WorkItem.comment_count >= min_comments)
+    if has_attachments is not None:
+        query = query.filter(WorkItem.attachment_count > 0 if has_attachments else WorkItem.attachment_count == 0)
+    if active_since is not None:
+        query = query.filter(WorkItem.last_activity_at >= active_since)
+    
+    cursor_mode = pagination == "cursor" or cursor
+    
+    # Select plain columns and read them through Core: the list is read-only,
+    # so ORM hydration and identity-map bookkeeping would be wasted work
+    field_names = parse_fields(fields, WorkItemSchema)
+    if field_names:
+        selected = set(field_names) | (set(keyset_columns(order_by)) if cursor_mode else set())
+        query = query.with_entities(*sparse_columns(WorkItem, selected))
+    else:
+        query = query.with_entities(*schema_columns(WorkItem, WorkItemSchema))
+    
+    # Cursor mode: seek by the sort key instead of scanning skipped rows
+    if cursor_mode:
+        items = read_rows(db, apply_keyset_page(query, order_by, cursor, limit))
+        next_cursor = next_cursor_for(items, limit, *keyset_columns(order_by))
+        if field_names:
+            return set_etag(sparse_page_response(WorkItemSchema, field_names, [row._asdict() for row in items[:limit]], next_cursor), etag)
+        return set_etag(fast_response(request, {
+            "items": serialize_rows(WorkItemSchema, items[:limit]),
+            "next_cursor": next_cursor
+        }), etag)
+    
+    if order_by != "id":
+        query = apply_sort(query, order_by)
+    items = read_rows(db, query.offset(skip).limit(limit))
+    if field_names:
+        return set_etag(sparse_response(WorkItemSchema, field_names, [row._asdict() for row in items]), etag)
+    return set_etag(fast_response(request, serialize_rows(WorkItemSchema, items)), etag)
+
+@router.get("/changes", response_model=WorkItemChanges)
+def read_item_changes(
+    since: Optional[str] = Query(None, description="Cursor from a previous response; omit for a full sync"),
+    limit: int = Query(default=500, ge=1, le=5000),
+    branch_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Items created or updated, and ids removed from view, since a cursor"""
+    last_seq, last_id = decode_cursor(since, int, int) if since else (0, 0)
+    head, = get_table_versions(db, "work_items")
+    
+    visible = scoped_items_query(db, current_user, branch_id=branch_id)
+    items = visible.filter(
+        tuple_(WorkItem.change_seq, WorkItem.id) > tuple_(last_seq, last_id),
+        WorkItem.change_seq <= head
+    ).order_by(WorkItem.change_seq, WorkItem.id).limit(limit + 1).all()
+    
+    has_more = len(items) > limit
+    items = items[:limit]
+    if has_more:
+        upper = items[-1].change_seq
+        cursor = encode_cursor(items[-1].change_seq, items[-1].id)
+    else:
+        # Caught up: resume after everything up to head, or after the last item
+        # if it shares head's sequence
+        upper = head
+        cursor = encode_cursor(*max((head, 0), (items[-1].change_seq, items[-1].id) if items else (last_seq, last_id)))
+    
+    # Tombstones use the same branch scoping as scoped_items_query, minus
+    # items that are visible again (moved back, or visible via another branch)
+    tombstones = db.query(WorkItemTombstone.item_id).filter(
+        WorkItemTombstone.change_seq > last_seq,
+        WorkItemTombstone.change_seq <= upper,
+        ~WorkItemTombstone.item_id.in_(visible.with_entities(WorkItem.id).scalar_subquery())
+    )
+    if current_user.role == "requester" or (current_user.role == "dev" and current_user.branch_id is not None):
+        tombstones = tombstones.filter(WorkItemTombstone.branch_id == current_user.branch_id)
+    if branch_id is not None:
+        tombstones = tombstones.filter(WorkItemTombstone.branch_id == branch_id)
+    deleted = sorted({item_id for item_id, in tombstones})
+    
+    return {"items": items, "deleted": deleted, "cursor": cursor, "has_more": has_more}
+
+# Columns of the WorkItem response schema, selected without building ORM objects
+STREAM_COLUMNS = list(schema_columns(WorkItem, WorkItemSchema))
+
+@router.get("/stream")
+def stream_items(
+    type: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    assignee_id: Optional[str] = Query(None),
+    branch_id: Optional[int] = Query(None),
+    limit: Optional[int] = Query(None, ge=1),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Stream matching items as NDJSON from a server-side cursor"""
+    def rows():
+        # The response outlives the request dependencies, so use a dedicated session
+        db = SessionLocal()
+        try:
+            query = scoped_items_query(
+                db, current_user, type, status, assignee_id, branch_id,
+                query=db.query(*STREAM_COLUMNS)
+            ).order_by(WorkItem.id)
+            if limit is not None:
+                query = query.limit(limit)
+            query = query.yield_per(STREAM_BATCH_SIZE)
+            for row in query:
+                yield row._asdict()
+        finally:
+            db.close()
+    
+    return StreamingResponse(ndjson_chunks(rows()), media_type="application/x-ndjson")
+
+@router.get("/export")
+def export_items(
+    format: str = Query("csv", pattern="^(csv|xlsx|ndjson)$"),
+    type: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    assignee_id: Optional[str] = Query(None),
+    branch_id: Optional[int] = Query(None),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Export tickets with their comments and assignee/reporter/branch names"""
+    filename = f"tickets_{date.today().isoformat()}"
+    
+    def rows():
+        # The response outlives the request dependencies, so use a dedicated session
+        db = SessionLocal()
+        try:
+            query = scoped_items_query(db, current_user, type, status, assignee_id, branch_id, query=export_columns(db))
+            yield from stream_export_rows(query)
+        finally:
+            db.close()
+    
+    if format == "ndjson":
+        return StreamingResponse(
+            ndjson_chunks(group_tickets(rows())),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": f"attachment; filename=\"{filename}.ndjson\""}
+        )
+    if format == "csv":
+        return StreamingResponse(
+            csv_chunks(rows()),
+            media_type="text/csv",
+            headers={"Content-Disposition": f"attachment; filename=\"{filename}.csv\""}
+        )
+    
+    # xlsx is a zip archive, so it is written to a temp file in write-only mode and then sent
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        write_xlsx(rows(), path)
+    except Exception:
+        os.remove(path)
+        raise
+    return FileResponse(
+        path,
+        filename=f"{filename}.xlsx",
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        background=BackgroundTask(os.remove, path)
+    )
+
+@router.get("/search", response_model=List[WorkItemSearchHit])
+def search_items(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = 0,
+    limit: int = Query(default=50, le=200),
+    type: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    assignee_id: Optional[str] = Query(None),
+    branch_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Search ticket titles, descriptions and comments, best matches first"""
+    scores = search_scores(db, q)
+    query = scoped_items_query(
+        db, current_user, type, status, assignee_id, branch_id,
+        query=db.query(WorkItem, scores.c.score).join(scores, scores.c.item_id == WorkItem.id)
+    )
+    rows = query.order_by(scores.c.score.desc(), WorkItem.id.desc()).offset(skip).limit(limit).all()
+    return [
+        {**WorkItemSchema.model_validate(item).model_dump(), "score": float(score)}
+        for item, score in rows
+    ]
+
+@router.get("/stats", response_model=WorkItemStats)
+def read_item_stats(
+    type: Optional[str] = Query(None),
+    assignee_id: Optional[str] = Query(None),
+    branch_id: Optional[int] = Query(None),
+    days: int = Query(default=30, ge=1, le=365),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get grouped item counts with the same branch scoping as read_items"""
+    def scoped(*columns):
+        return scoped_items_query(db, current_user, type, None, assignee_id, branch_id, query=db.query(*columns))
+    
+    is_open = WorkItem.status != "done"
+    count = func.count(WorkItem.id)
+    
+    by_status_type_priority = scoped(WorkItem.status, WorkItem.type, WorkItem.priority, count).group_by(
+        WorkItem.status, WorkItem.type, WorkItem.priority
+    ).all()
+    
+    open_by_branch = scoped(WorkItem.branch_id, Branch.name, count).outerjoin(
+        Branch, Branch.id == WorkItem.branch_id
+    ).filter(is_open).group_by(WorkItem.branch_id, Branch.name).all()
+    
+    open_by_assignee = scoped(WorkItem.assignee_id, User.name, count).outerjoin(
+        User, User.id == WorkItem.assignee_id
+    ).filter(is_open).group_by(WorkItem.assignee_id, User.name).all()
+    
+    now = datetime.now(timezone.utc)
+    overdue = scoped(count).filter(is_open, WorkItem.due_at.isnot(None), WorkItem.due_at < now).scalar()
+    
+    since = now - timedelta(days=days)
+    created_day = func.date(WorkItem.created_at)
+    created_per_day = scoped(created_day, count).filter(
+        WorkItem.created_at >= since
+    ).group_by(created_day).order_by(created_day).all()
+    
+    closed_day = func.date(WorkItem.completed_at)
+    closed_per_day = scoped(closed_day, count).filter(
+        WorkItem.completed_at >= since
+    ).group_by(closed_day).order_by(closed_day).all()
+    
+    return {
+        "total": sum(row[-1] for row in by_status_type_priority),
+        "open": sum(row[-1] for row in by_status_type_priority if row[0] != "done"),
+        "overdue": overdue or 0,
+        "by_status_type_priority": [
+            {"status": status, "type": type_, "priority": priority, "count": n}
+            for status, type_, priority, n in by_status_type_priority
+        ],
+        "open_by_branch": [{"id": id_, "name": name, "count": n} for id_, name, n in open_by_branch],
+        "open_by_assignee": [{"id": id_, "name": name, "count": n} for id_, name, n in open_by_assignee],
+        "created_per_day": [{"date": day, "count": n} for day, n in created_per_day],
+        "closed_per_day": [{"date": day, "count": n} for day, n in closed_per_day]
+    }
 
 @router.get("/{item_id}", response_model=WorkItemWithComments)
 @router.get("{item_id}", response_model=WorkItemWithComments)
-def read_item(item_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+def read_item(item_id: int, request: Request, response: Response, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    etag = make_etag(request, current_user, *get_table_versions(db, "work_items", "item_comments"))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+    
     item = db.query(WorkItem).filter(WorkItem.id == item_id).first()
     if item is None:
         raise HTTPException(status_code=404, detail="Item not found")
     return item
 
+@router.get("/{item_id}/bundle", response_model=WorkItemBundle)
+@router.get("{item_id}/bundle", response_model=WorkItemBundle)
+def read_item_bundle(item_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    """Get an item with its comments, attachments, time stats and referenced users"""
+    # Comments and attachments are eager loaded so the page costs a fixed number of queries
+    item = db.query(WorkItem).options(
+        selectinload(WorkItem.comments),
+        selectinload(WorkItem.attachments)
+    ).filter(WorkItem.id == item_id).first()
+    if item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    
+    comments = sorted(item.comments, key=lambda comment: (comment.created_at, comment.id))
+    
+    # Load only the users this ticket refers to
+    user_ids = {item.reporter_id, item.assignee_id}
+    user_ids.update(comment.user_id for comment in comments)
+    user_ids.update(attachment.uploaded_by for attachment in item.attachments)
+    user_ids.discard(None)
+    users = db.query(User).filter(User.id.in_(user_ids)).all() if user_ids else []
+    users_by_id = {user.id: user for user in users}
+    
+    return {
+        "item": item,
+        "comments": [
+            {
+                "id": comment.id,
+                "item_id": comment.item_id,
+                "user_id": comment.user_id,
+                "body": comment.body,
+                "created_at": comment.created_at,
+                "user_name": users_by_id[comment.user_id].name if comment.user_id in users_by_id else None,
+                "user_role": users_by_id[comment.user_id].role if comment.user_id in users_by_id else None,
+            }
+            for comment in comments
+        ],
+        "attachments": item.attachments,
+        "time_stats": calculate_ticket_time_stats(db, item),
+        "users": users
+    }
+
+MAX_BULK_ITEMS = 500
+# Bulk fields that may be changed but not cleared
+NON_NULLABLE_BULK_FIELDS = ("status", "priority")
+
+@router.patch("/bulk", response_model=WorkItemBulkResult)
+def bulk_update_items(
+    bulk_update: WorkItemBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Apply the same status/assignee/priority/date changes to many items in one transaction"""
+    ids = list(dict.fromkeys(bulk_update.ids))
+    if len(ids) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ITEMS} items per request")
+    
+    changes = bulk_update.dict(exclude_unset=True, exclude={"ids"})
+    if not changes:
+        raise HTTPException(status_code=400, detail="No changes provided")
+    cleared = [field for field in NON_NULLABLE_BULK_FIELDS if field in changes and changes[field] is None]
+    if cleared:
+        raise HTTPException(status_code=400, detail=f"{', '.join(cleared)} cannot be null")
+    
+    # Reassignment follows the same rules as assign_item
+    if "assignee_id" in changes:
+        if current_user.role != "pm":
+            raise HTTPException(status_code=403, detail="PM role required")
+        if changes["assignee_id"] is not None:
+            assignee = db.query(User).filter(User.id == changes["assignee_id"]).first()
+            if assignee is None:
+                raise HTTPException(status_code=404, detail="Assignee not found")
+            if assignee.role not in ("dev", "pm"):
+                raise HTTPException(status_code=400, detail="Can only assign to developers or PMs")
+    
+    # One SELECT for the current state of every visible item
+    before = {
+        row.id: row
+        for row in scoped_items_query(db, current_user, query=db.query(
+            WorkItem.id, WorkItem.status, WorkItem.assignee_id, WorkItem.reporter_id
+        )).filter(WorkItem.id.in_(ids))
+    }
+    found_ids = list(before)
+    
+    if found_ids:
+        now = datetime.now(timezone.utc)
+        
+        # Keep completed_at in step with status, as update_item does
+        if "status" in changes:
+            if changes["status"] == "done":
+                completing = [row.id for row in before.values() if row.status != "done"]
+                if completing:
+                    db.query(WorkItem).filter(WorkItem.id.in_(completing)).update(
+                        {"completed_at": now}, synchronize_session=False
+                    )
+            else:
+                reopening = [row.id for row in before.values() if row.status == "done"]
+                if reopening:
+                    db.query(WorkItem).filter(WorkItem.id.in_(reopening)).update(
+                        {"completed_at": None}, synchronize_session=False
+                    )
+        
+        values = {field: getattr(value, "value", value) for field, value in changes.items()}
+        values["updated_at"] = now
+        values["last_activity_at"] = now
+        values["change_seq"] = next_change_seq(db)
+        db.query(WorkItem).filter(WorkItem.id.in_(found_ids)).update(values, synchronize_session=False)
+        
+        # Queue notifications for every affected item in the same transaction;
+        # the outbox worker inserts them all in one batch
+        for item_id, old in before.items():
+            assignee_id = values["assignee_id"] if "assignee_id" in values else old.assignee_id
+            newly_assigned = "assignee_id" in values and assignee_id and assignee_id != old.assignee_id
+            if newly_assigned:
+                notify_ticket_assigned(db, item_id, assignee_id, current_user.id)
+            
+            recipients = [user_id for user_id in dict.fromkeys([assignee_id, old.reporter_id]) if user_id is not None]
+            if "status" in values and old.status != values["status"]:
+                notify_ticket_status_changed(db, item_id, recipients, current_user.id, values["status"])
+            else:
+                notify_ticket_updated(db, item_id, [
+                    user_id for user_id in recipients if not (newly_assigned and user_id == assignee_id)
+                ], current_user.id)
+        db.commit()
+    
+    items = {item.id: item for item in db.query(WorkItem).filter(WorkItem.id.in_(found_ids))} if found_ids else {}
+    for item in items.values():
+        publish_item_event("item.assigned" if "assignee_id" in changes else "item.updated", item)
+    
+    results = [
+        {"id": item_id, "success": True, "item": items[item_id]}
+        if item_id in items else
+        {"id": item_id, "success": False, "detail": "Item not found"}
+        for item_id in ids
+    ]
+    return {"updated": len(items), "results": results}
+
 @router.patch("/{item_id}", response_model=WorkItemSchema)
 @router.patch("{item_id}", response_model=WorkItemSchema)
 def update_item(
@@ -127,6 +619,7 @@ def update_item(
         raise HTTPException(status_code=404, detail="Item not found")
     
     old_status = item.status
+    old_branch_id = item.branch_id
     update_data = item_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(item, field, value)
@@ -139,10 +632,13 @@ def update_item(
         item.completed_at = None
     
     item.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(item)
+    item.last_activity_at = item.updated_at
+    item.change_seq = next_change_seq(db)
+    # Clients syncing the old branch no longer see the item
+    if item.branch_id != old_branch_id:
+        record_item_removal(db, item.id, old_branch_id, item.change_seq)
     
-    # Send notifications
+    # Queue notifications; they commit with the update
     notify_users = []
     if item.assignee_id and item.assignee_id != current_user.id:
         notify_users.append(item.assignee_id)
@@ -154,6 +650,12 @@ def update_item(
     elif notify_users:
         notify_ticket_updated(db, item_id, notify_users, current_user.id)
     
+    db.commit()
+    db.refresh(item)
+    if item.branch_id != old_branch_id:
+        event_hub.publish("item.removed", {"id": item.id, "change_seq": item.change_seq}, branch_id=old_branch_id)
+    publish_item_event("item.updated", item)
+    
     return item
 
 @router.post("/{item_id}/comments", response_model=Comment)
@@ -169,16 +671,18 @@ def create_comment(
     if item is None:
         raise HTTPException(status_code=404, detail="Item not found")
     
+    # Bump the item before inserting the comment: every item write takes the
+    # work_items version row first, then the item row (see bump_item_counters)
+    bump_item_counters(db, item_id, comments=1)
     db_comment = ItemComment(
         item_id=item_id,
         user_id=current_user.id,
         body=comment.body
     )
     db.add(db_comment)
-    db.commit()
-    db.refresh(db_comment)
+    bump_table_version(db, "item_comments")
     
-    # Send notifications to assignee and reporter (except commenter)
+    # Notify assignee and reporter (except commenter) in the same transaction
     notify_users = []
     if item.assignee_id and item.assignee_id != current_user.id:
         notify_users.append(item.assignee_id)
@@ -188,18 +692,64 @@ def create_comment(
     if notify_users:
         notify_ticket_commented(db, item_id, notify_users, current_user.id)
     
+    db.commit()
+    db.refresh(db_comment)
+    
     return db_comment
 
-@router.get("/{item_id}/comments", response_model=List[Comment])
-@router.get("{item_id}/comments", response_model=List[Comment])
-def read_comments(item_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+# Default page size for cursor-paginated comments
+COMMENT_PAGE_SIZE = 100
+
+@router.get("/{item_id}/comments", response_model=Union[List[CommentWithAuthor], CommentPage])
+@router.get("{item_id}/comments", response_model=Union[List[CommentWithAuthor], CommentPage])
+def read_comments(
+    item_id: int,
+    skip: int = 0,
+    limit: Optional[int] = Query(default=None, ge=1, le=500),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Comments oldest first, with the author's name and role joined in
+    
+    Offset mode without a limit returns every comment, as it always has;
+    cursor mode pages by COMMENT_PAGE_SIZE unless a limit is given.
+    """
     # Verify item exists
-    item = db.query(WorkItem).filter(WorkItem.id == item_id).first()
+    item = db.query(WorkItem.id).filter(WorkItem.id == item_id).first()
     if item is None:
         raise HTTPException(status_code=404, detail="Item not found")
     
-    comments = db.query(ItemComment).filter(ItemComment.item_id == item_id).all()
-    return comments
+    query = db.query(
+        ItemComment.id,
+        ItemComment.item_id,
+        ItemComment.user_id,
+        ItemComment.body,
+        ItemComment.created_at,
+        User.name.label("user_name"),
+        User.role.label("user_role")
+    ).outerjoin(
+        User, User.id == ItemComment.user_id
+    ).filter(
+        ItemComment.item_id == item_id
+    ).order_by(ItemComment.created_at, ItemComment.id)
+    
+    if pagination == "cursor" or cursor:
+        limit = limit or COMMENT_PAGE_SIZE
+        if cursor:
+            created_at, last_id = decode_cursor(cursor, datetime, int)
+            query = query.filter(tuple_(ItemComment.created_at, ItemComment.id) > tuple_(created_at, last_id))
+        comments = query.limit(limit + 1).all()
+        return {
+            "items": comments[:limit],
+            "next_cursor": next_cursor_for(comments, limit, "created_at", "id")
+        }
+    
+    query = query.offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
 
 @router.patch("/{item_id}/assign", response_model=WorkItemSchema)
 @router.patch("{item_id}/assign", response_model=WorkItemSchema)
@@ -228,11 +778,15 @@ def assign_item(
     # Update assignment
     old_assignee_id = item.assignee_id
     item.assignee_id = assignment.assignee_id
-    db.commit()
-    db.refresh(item)
+    item.last_activity_at = datetime.now(timezone.utc)
+    item.change_seq = next_change_seq(db)
     
-    # Send notification to new assignee
+    # Notify the new assignee in the same transaction
     if old_assignee_id != assignment.assignee_id:
         notify_ticket_assigned(db, item_id, assignment.assignee_id, current_user.id)
     
+    db.commit()
+    db.refresh(item)
+    publish_item_event("item.assigned", item)
+    
     return item
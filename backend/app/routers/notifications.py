@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.user import User
 from app.models.notification import Notification, NotificationPreference
 from app.schemas.notification import (
@@ -11,8 +12,13 @@ from app.schemas.notification import (
     NotificationPreference as NotificationPreferenceSchema,
     NotificationPreferenceUpdate
 )
-from app.auth import get_current_active_user
+from app.auth import get_current_active_user, get_current_active_user_async
+from app.serialization import fast_response, serialize_rows
+from app.services.preference_cache_service import store_preferences
+from app.services.unread_count_service import decrement_unread_count
 from app.services.notification_service import (
+    fan_out_metrics,
+    list_notifications,
     mark_as_read,
     mark_all_as_read,
     get_unread_count,
@@ -23,31 +29,34 @@ router = APIRouter()
 
 @router.get("/", response_model=List[NotificationSchema])
 @router.get("", response_model=List[NotificationSchema])
-def get_notifications(
+async def get_notifications(
+    request: Request,
     skip: int = 0,
     limit: int = 50,
     unread_only: bool = False,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """Get user's notifications"""
-    query = db.query(Notification).filter(Notification.user_id == current_user.id)
-    
-    if unread_only:
-        query = query.filter(Notification.is_read == False)
-    
-    notifications = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
-    return notifications
+    notifications = await db.run_sync(list_notifications, current_user.id, skip, limit, unread_only)
+    return fast_response(request, serialize_rows(NotificationSchema, notifications))
 
 @router.get("/unread-count")
-def get_unread_notification_count(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+async def get_unread_notification_count(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """Get count of unread notifications"""
-    count = get_unread_count(db, current_user.id)
+    count = await db.run_sync(get_unread_count, current_user.id)
     return {"count": count}
 
+@router.get("/metrics")
+def get_notification_metrics(current_user: User = Depends(get_current_active_user)):
+    """Notifications created per request by this worker process (PM only)"""
+    if current_user.role != "pm":
+        raise HTTPException(status_code=403, detail="Only PMs can view notification metrics")
+    return fan_out_metrics.snapshot()
+
 @router.patch("/{notification_id}/read", response_model=NotificationSchema)
 @router.patch("{notification_id}/read", response_model=NotificationSchema)
 def mark_notification_read(
@@ -93,6 +102,8 @@ def delete_notification(
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
     
+    if not notification.is_read:
+        decrement_unread_count(db, current_user.id)
     db.delete(notification)
     db.commit()
     return {"message": "Notification deleted"}
@@ -116,15 +127,7 @@ def update_notification_preferences(
     current_user: User = Depends(get_current_active_user)
 ):
     """Update user's notification preferences"""
-    prefs = get_or_create_preferences(db, current_user.id)
-    
-    update_data = preferences.dict()
-    for field, value in update_data.items():
-        setattr(prefs, field, value)
-    
-    db.commit()
-    db.refresh(prefs)
-    return prefs
+    return store_preferences(db, current_user.id, preferences.dict())
 
 
 
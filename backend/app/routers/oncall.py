@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -8,6 +8,8 @@ from app.models.oncall_roster import OncallRoster
 from app.schemas.oncall import OncallRosterWithUser, OncallSeedRequest
 from app.auth import get_current_active_user, require_pm_role
 from app.services.oncall_service import get_current_oncall_user, seed_oncall_roster
+from app.services.table_version_service import get_table_versions
+from app.http_cache import make_etag, not_modified
 
 router = APIRouter()
 
@@ -24,8 +26,14 @@ def get_current_oncall(db: Session = Depends(get_db), current_user: User = Depen
     return {"user_id": None, "name": None, "email": None}
 
 @router.get("/roster", response_model=List[OncallRosterWithUser])
-def get_oncall_roster(db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+def get_oncall_roster(request: Request, response: Response, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
     """Get the on-call roster schedule"""
+    # Roster entries embed their user and that user's branch
+    etag = make_etag(request, current_user, *get_table_versions(db, "oncall_roster", "users", "branches"))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+    
     roster = db.query(OncallRoster).order_by(OncallRoster.starts_on).all()
     return roster
 
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, select
 from datetime import datetime, date, timedelta, timezone
 from typing import List, Dict, Any
 
@@ -10,10 +10,24 @@ from app.models.work_item import WorkItem
 from app.models.oncall_roster import OncallRoster
 from app.schemas.reports import WeeklyReport, StandupDigest, SLAAlert
 from app.auth import get_current_active_user
+from app.rows import read_columns, read_rows
 from app.services.oncall_service import get_current_oncall_user, get_monday_of_week
 
 router = APIRouter()
 
+def mean_hours_open(db: Session, item_type: str, week_start: date, week_end: date) -> float:
+    """Mean created-to-done time of items of a type closed in the week"""
+    created, updated = read_columns(db, select(WorkItem.created_at, WorkItem.updated_at).where(
+        WorkItem.type == item_type,
+        WorkItem.status == "done",
+        WorkItem.updated_at >= week_start,
+        WorkItem.updated_at < week_end + timedelta(days=1)
+    ))
+    if not created:
+        return 0
+    total_hours = sum((done - opened).total_seconds() for opened, done in zip(created, updated)) / 3600
+    return total_hours / len(created)
+
 @router.get("/weekly", response_model=WeeklyReport)
 def get_weekly_report(db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
     """Get weekly report with metrics"""
@@ -55,40 +69,10 @@ def get_weekly_report(db: Session = Depends(get_db), current_user: User = Depend
     ).count()
     
     # Calculate MTTR (Mean Time To Resolution) for support tickets
-    mttr_items = db.query(WorkItem).filter(
-        and_(
-            WorkItem.type == "support",
-            WorkItem.status == "done",
-            WorkItem.updated_at >= week_start,
-            WorkItem.updated_at < week_end + timedelta(days=1)
-        )
-    ).all()
-    
-    mttr_hours = 0
-    if mttr_items:
-        total_hours = sum([
-            (item.updated_at - item.created_at).total_seconds() / 3600
-            for item in mttr_items
-        ])
-        mttr_hours = total_hours / len(mttr_items)
+    mttr_hours = mean_hours_open(db, "support", week_start, week_end)
     
     # Calculate feature lead time
-    feature_items = db.query(WorkItem).filter(
-        and_(
-            WorkItem.type == "feature",
-            WorkItem.status == "done",
-            WorkItem.updated_at >= week_start,
-            WorkItem.updated_at < week_end + timedelta(days=1)
-        )
-    ).all()
-    
-    lead_time_hours = 0
-    if feature_items:
-        total_hours = sum([
-            (item.updated_at - item.created_at).total_seconds() / 3600
-            for item in feature_items
-        ])
-        lead_time_hours = total_hours / len(feature_items)
+    lead_time_hours = mean_hours_open(db, "feature", week_start, week_end)
     
     return WeeklyReport(
         week_start=week_start,
@@ -101,6 +85,8 @@ def get_weekly_report(db: Session = Depends(get_db), current_user: User = Depend
         oncall_user=oncall_name
     )
 
+DIGEST_COLUMNS = (WorkItem.id, WorkItem.title, WorkItem.status, WorkItem.updated_at)
+
 @router.get("/standup/{user_id}", response_model=StandupDigest)
 def get_standup_digest(user_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
     """Get standup digest for a specific user"""
@@ -110,32 +96,32 @@ def get_standup_digest(user_id: int, db: Session = Depends(get_db), current_user
     
     # Get items moved in the last 24 hours
     yesterday = datetime.now(timezone.utc) - timedelta(days=1)
-    yesterday_moved = db.query(WorkItem).filter(
+    yesterday_moved = read_rows(db, select(*DIGEST_COLUMNS).where(
         and_(
             or_(WorkItem.assignee_id == user_id, WorkItem.reporter_id == user_id),
             WorkItem.updated_at >= yesterday,
             WorkItem.updated_at != WorkItem.created_at  # Exclude newly created items
         )
-    ).all()
+    ))
     
     # Get items assigned today
     today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-    today_assigned = db.query(WorkItem).filter(
+    today_assigned = read_rows(db, select(*DIGEST_COLUMNS).where(
         and_(
             WorkItem.assignee_id == user_id,
             WorkItem.updated_at >= today_start
         )
-    ).all()
+    ))
     
     # Get blockers (items stuck >2 days in same status)
     two_days_ago = datetime.now(timezone.utc) - timedelta(days=2)
-    blockers = db.query(WorkItem).filter(
+    blockers = read_rows(db, select(*DIGEST_COLUMNS).where(
         and_(
             WorkItem.assignee_id == user_id,
             WorkItem.status.in_(["backlog", "in_progress", "review"]),
             WorkItem.updated_at <= two_days_ago
         )
-    ).all()
+    ))
     
     return StandupDigest(
         user_id=user.id,
@@ -152,13 +138,16 @@ def get_sla_alerts(db: Session = Depends(get_db), current_user: User = Depends(g
     four_hours_from_now = now + timedelta(hours=4)
     
     # Get items due in next 4 hours or overdue
-    items = db.query(WorkItem).filter(
+    # Join the assignee's name instead of lazy-loading it per item
+    items = read_rows(db, select(
+        WorkItem.id, WorkItem.title, WorkItem.due_at, User.name.label("assignee_name")
+    ).outerjoin(User, User.id == WorkItem.assignee_id).where(
         and_(
             WorkItem.status.in_(["backlog", "in_progress", "review"]),
             WorkItem.due_at.isnot(None),
             WorkItem.due_at <= four_hours_from_now
         )
-    ).all()
+    ))
     
     alerts = []
     for item in items:
@@ -173,7 +162,7 @@ def get_sla_alerts(db: Session = Depends(get_db), current_user: User = Depends(g
         alerts.append(SLAAlert(
             item_id=item.id,
             title=item.title,
-            assignee=item.assignee.name if item.assignee else "Unassigned",
+            assignee=item.assignee_name or "Unassigned",
             due_at=due_at,
             hours_remaining=abs(hours_remaining),
             is_overdue=is_overdue
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, extract
+from sqlalchemy import func, and_, extract, select
 from typing import List, Optional
 from datetime import datetime, date, timedelta, timezone
 from decimal import Decimal
@@ -20,6 +20,11 @@ from app.schemas.time_entry import (
     TimeSummary
 )
 from app.auth import get_current_active_user
+from app.services.time_tracking_service import calculate_ticket_time_stats
+from app.services.item_counter_service import bump_item_counters
+from app.fieldsets import parse_fields, sparse_columns, sparse_response
+from app.serialization import fast_response, row_serializer
+from app.rows import read_rows
 
 router = APIRouter()
 
@@ -44,6 +49,7 @@ def create_time_entry(
     if current_user.role == 'dev' and work_item.assignee_id != current_user.id:
         raise HTTPException(status_code=403, detail="You can only log time on your assigned tickets")
     
+    bump_item_counters(db, entry.work_item_id, hours=entry.hours)
     db_entry = TimeEntry(
         work_item_id=entry.work_item_id,
         user_id=current_user.id,
@@ -64,32 +70,37 @@ def create_time_entry(
 @router.get("/ticket/{ticket_id}", response_model=List[TimeEntryWithUser])
 def get_ticket_time_entries(
     ticket_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all time entries for a specific ticket"""
-    work_item = db.query(WorkItem).filter(WorkItem.id == ticket_id).first()
+    work_item = db.query(WorkItem.id).filter(WorkItem.id == ticket_id).first()
     if not work_item:
         raise HTTPException(status_code=404, detail="Work item not found")
     
-    entries = db.query(TimeEntry).filter(
+    # User names are joined in rather than looked up per entry
+    entries = db.query(TimeEntry, User.name).outerjoin(
+        User, User.id == TimeEntry.user_id
+    ).filter(
         TimeEntry.work_item_id == ticket_id
     ).order_by(TimeEntry.logged_at.desc()).all()
     
-    # Add user names
+    serialize = row_serializer(TimeEntrySchema)
     result = []
-    for entry in entries:
-        entry_dict = TimeEntrySchema.model_validate(entry).model_dump()
-        user = db.query(User).filter(User.id == entry.user_id).first()
-        entry_dict['user_name'] = user.name if user else "Unknown"
+    for entry, user_name in entries:
+        entry_dict = serialize(entry)
+        entry_dict['user_name'] = user_name or "Unknown"
         result.append(entry_dict)
     
-    return result
+    return fast_response(request, result)
 
 @router.get("/my-entries", response_model=List[TimeEntryWithUser])
 def get_my_time_entries(
+    request: Request,
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of entry fields to return"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -101,19 +112,32 @@ def get_my_time_entries(
     if end_date:
         query = query.filter(func.date(TimeEntry.logged_at) <= end_date)
     
-    entries = query.order_by(TimeEntry.logged_at.desc()).all()
+    query = query.order_by(TimeEntry.logged_at.desc())
+    
+    # Sparse fieldsets select only the requested columns
+    field_names = parse_fields(fields, TimeEntryWithUser)
+    if field_names:
+        rows = [row._asdict() for row in query.with_entities(*sparse_columns(TimeEntry, field_names))]
+        if "user_name" in field_names:
+            for row in rows:
+                row["user_name"] = current_user.name
+        return sparse_response(TimeEntryWithUser, field_names, rows)
+    
+    entries = query.all()
     
+    serialize = row_serializer(TimeEntrySchema)
     result = []
     for entry in entries:
-        entry_dict = TimeEntrySchema.model_validate(entry).model_dump()
+        entry_dict = serialize(entry)
         entry_dict['user_name'] = current_user.name
         result.append(entry_dict)
     
-    return result
+    return fast_response(request, result)
 
 @router.get("/user/{user_id}", response_model=List[TimeEntryWithUser])
 def get_user_time_entries(
     user_id: int,
+    request: Request,
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
@@ -135,13 +159,14 @@ def get_user_time_entries(
     user = db.query(User).filter(User.id == user_id).first()
     user_name = user.name if user else "Unknown"
     
+    serialize = row_serializer(TimeEntrySchema)
     result = []
     for entry in entries:
-        entry_dict = TimeEntrySchema.model_validate(entry).model_dump()
+        entry_dict = serialize(entry)
         entry_dict['user_name'] = user_name
         result.append(entry_dict)
     
-    return result
+    return fast_response(request, result)
 
 @router.patch("/{entry_id}", response_model=TimeEntrySchema)
 def update_time_entry(
@@ -160,9 +185,11 @@ def update_time_entry(
         raise HTTPException(status_code=403, detail="You can only update your own time entries")
     
     # Update fields
+    old_hours = db_entry.hours
     for field, value in entry_update.model_dump(exclude_unset=True).items():
         setattr(db_entry, field, value)
     
+    bump_item_counters(db, db_entry.work_item_id, hours=Decimal(db_entry.hours) - Decimal(old_hours))
     db.commit()
     db.refresh(db_entry)
     
@@ -184,6 +211,7 @@ def delete_time_entry(
         raise HTTPException(status_code=403, detail="You can only delete your own time entries")
     
     db.delete(db_entry)
+    bump_item_counters(db, db_entry.work_item_id, hours=-Decimal(db_entry.hours))
     db.commit()
     
     return {"message": "Time entry deleted successfully"}
@@ -227,6 +255,7 @@ def start_timer(
     )
     
     db.add(db_entry)
+    bump_item_counters(db, timer.work_item_id)
     db.commit()
     db.refresh(db_entry)
     
@@ -268,6 +297,7 @@ def stop_timer(
     if timer_stop.description:
         db_entry.description = timer_stop.description
     
+    bump_item_counters(db, db_entry.work_item_id, hours=hours)
     db.commit()
     db.refresh(db_entry)
     
@@ -300,37 +330,7 @@ def get_ticket_time_stats(
     if not work_item:
         raise HTTPException(status_code=404, detail="Work item not found")
     
-    # Calculate totals
-    result = db.query(
-        func.sum(TimeEntry.hours).label('total_hours'),
-        func.sum(func.IF(TimeEntry.is_billable == True, TimeEntry.hours, 0)).label('billable_hours'),
-        func.sum(func.IF(TimeEntry.is_billable == False, TimeEntry.hours, 0)).label('non_billable_hours'),
-        func.count(TimeEntry.id).label('entry_count')
-    ).filter(TimeEntry.work_item_id == ticket_id).first()
-    
-    total_hours = result.total_hours or Decimal('0')
-    billable_hours = result.billable_hours or Decimal('0')
-    non_billable_hours = result.non_billable_hours or Decimal('0')
-    entry_count = result.entry_count or 0
-    
-    # Calculate remaining and percent
-    estimated_hours = work_item.estimated_hours
-    remaining_hours = None
-    percent_complete = None
-    
-    if estimated_hours and estimated_hours > 0:
-        remaining_hours = max(Decimal('0'), estimated_hours - total_hours)
-        percent_complete = min(100.0, float((total_hours / estimated_hours) * 100))
-    
-    return TimeStats(
-        total_hours=total_hours,
-        billable_hours=billable_hours,
-        non_billable_hours=non_billable_hours,
-        entry_count=entry_count,
-        estimated_hours=estimated_hours,
-        remaining_hours=remaining_hours,
-        percent_complete=percent_complete
-    )
+    return calculate_ticket_time_stats(db, work_item)
 
 @router.get("/stats/user/{user_id}", response_model=TimeStats)
 def get_user_time_stats(
@@ -379,18 +379,23 @@ def get_time_summary(
     if current_user.role != 'pm':
         raise HTTPException(status_code=403, detail="Only PMs can view time summaries")
     
-    query = db.query(TimeEntry)
+    # Read plain rows through Core with the user's name joined in, rather than
+    # loading every entry into the session and querying its user one by one
+    query = select(
+        TimeEntry.hours, TimeEntry.is_billable, TimeEntry.activity_type, TimeEntry.logged_at,
+        TimeEntry.user_id, User.name.label("user_name")
+    ).outerjoin(User, User.id == TimeEntry.user_id)
     
     if start_date:
-        query = query.filter(func.date(TimeEntry.logged_at) >= start_date)
+        query = query.where(func.date(TimeEntry.logged_at) >= start_date)
     if end_date:
-        query = query.filter(func.date(TimeEntry.logged_at) <= end_date)
+        query = query.where(func.date(TimeEntry.logged_at) <= end_date)
     if ticket_id:
-        query = query.filter(TimeEntry.work_item_id == ticket_id)
+        query = query.where(TimeEntry.work_item_id == ticket_id)
     if user_id:
-        query = query.filter(TimeEntry.user_id == user_id)
+        query = query.where(TimeEntry.user_id == user_id)
     
-    entries = query.all()
+    entries = read_rows(db, query)
     
     # Calculate totals
     total_hours = sum(entry.hours for entry in entries)
@@ -406,8 +411,7 @@ def get_time_summary(
     # Group by user
     by_user = {}
     for entry in entries:
-        user = db.query(User).filter(User.id == entry.user_id).first()
-        user_name = user.name if user else f"User {entry.user_id}"
+        user_name = entry.user_name or f"User {entry.user_id}"
         by_user[user_name] = by_user.get(user_name, Decimal('0')) + entry.hours
     
     # Group by date
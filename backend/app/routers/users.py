@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from passlib.context import CryptContext
 
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
-from app.auth import get_current_active_user
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.auth import get_current_active_user, invalidate_user_cache
+from app.services.password_service import hash_password
+from app.services.token_version_service import bump_token_version
+from app.services.table_version_service import bump_table_version, get_table_versions
+from app.http_cache import make_etag, not_modified
 
 router = APIRouter()
 
@@ -30,7 +31,7 @@ def create_user(
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Hash password
-    hashed_password = pwd_context.hash(user.password)
+    hashed_password = hash_password(user.password)
     
     # Create user
     db_user = User(
@@ -43,6 +44,7 @@ def create_user(
     )
     
     db.add(db_user)
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(db_user)
     return db_user
@@ -53,9 +55,17 @@ def read_users(
     skip: int = 0, 
     limit: int = 100, 
     branch_id: Optional[int] = Query(None),
+    request: Request = None,
+    response: Response = None,
     db: Session = Depends(get_db), 
     current_user: User = Depends(get_current_active_user)
 ):
+    # Users embed their branch, so either table changing invalidates the list
+    etag = make_etag(request, current_user, *get_table_versions(db, "users", "branches"))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+    
     query = db.query(User)
     
     # Branch filtering based on user role
@@ -75,8 +85,8 @@ def read_users(
     return users
 
 @router.get("/me", response_model=UserSchema)
-def read_user_me(current_user: User = Depends(get_current_active_user)):
-    return current_user
+def read_user_me(current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+    return db.query(User).filter(User.id == current_user.id).first()
 
 @router.patch("/{user_id}", response_model=UserSchema)
 @router.patch("{user_id}", response_model=UserSchema)
@@ -94,10 +104,23 @@ def update_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    old_email = user.email
     update_data = user_update.dict(exclude_unset=True)
+    
+    # Tokens embed these fields, so changing any of them revokes the user's tokens
+    revoke_tokens = any(
+        field in update_data and update_data[field] != getattr(user, field)
+        for field in ("email", "name", "role", "branch_id", "is_active")
+    )
     for field, value in update_data.items():
         setattr(user, field, value)
     
+    if revoke_tokens:
+        bump_token_version(db, user.id)
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
+    
+    # Name, role, branch and deactivation changes must apply to the next request
+    invalidate_user_cache(old_email, user.email)
     return user
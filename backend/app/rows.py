@@ -0,0 +1,33 @@
+from functools import lru_cache
+from typing import Any, List, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query, Session
+
+def read_rows(db: Session, statement: Any) -> Sequence[Row]:
+    """Run a read-only select through Core on the session's connection
+
+    Returns SQLAlchemy Row tuples (slotted, attribute access by column label)
+    instead of ORM instances, so nothing enters the identity map and there is
+    no change tracking. Pending changes are not autoflushed: only use it on
+    read paths. Accepts a Select or a column Query.
+    """
+    if isinstance(statement, Query):
+        statement = statement.statement
+    return db.connection().execute(statement).all()
+
+def read_columns(db: Session, statement: Any) -> Tuple[List[Any], ...]:
+    """Like read_rows, but transposed into one list per selected column"""
+    if isinstance(statement, Query):
+        statement = statement.statement
+    rows = read_rows(db, statement)
+    if not rows:
+        return tuple([] for _ in statement.selected_columns)
+    return tuple(list(column) for column in zip(*rows))
+
+@lru_cache(maxsize=64)
+def schema_columns(table_model: Any, schema: Type[BaseModel]) -> tuple:
+    """Table columns backing a response schema's fields, labelled by field name"""
+    table = table_model.__table__
+    return tuple(table.c[name] for name in schema.model_fields if name in table.c)
@@ -9,6 +9,13 @@ from app.database import SessionLocal
 from app.models.user import User
 from app.models.work_item import WorkItem
 from app.services.oncall_service import get_current_oncall_user, get_monday_of_week
+from app.services.item_counter_service import repair_item_counters
+from app.services.unread_count_service import reconcile_unread_counts
+from app.services.notification_retention_service import (
+    NOTIFICATION_RETENTION_OPTIMIZE,
+    optimize_notifications_table,
+    purge_read_notifications
+)
 from app.notifications.email_service import send_email
 from app.notifications.slack_service import send_slack_message
 
@@ -163,6 +170,41 @@ def rotate_oncall():
     finally:
         db.close()
 
+def repair_counters():
+    """Recompute per-item activity counters that drifted from the source tables"""
+    db = SessionLocal()
+    try:
+        repair_item_counters(db)
+    except Exception as e:
+        logger.error(f"Error repairing item counters: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+def reconcile_unread_notifications():
+    """Recount unread notifications and fix per-user counters that drifted"""
+    db = SessionLocal()
+    try:
+        reconcile_unread_counts(db)
+    except Exception as e:
+        logger.error(f"Error reconciling unread notification counters: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+def purge_notifications():
+    """Delete or archive old read notifications in small batches"""
+    db = SessionLocal()
+    try:
+        report = purge_read_notifications(db)
+        if NOTIFICATION_RETENTION_OPTIMIZE and report["purged"]:
+            optimize_notifications_table(db)
+    except Exception as e:
+        logger.error(f"Error purging old notifications: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
 def start_scheduler():
     """Start the background scheduler"""
     scheduler = BackgroundScheduler()
@@ -194,5 +236,32 @@ def start_scheduler():
         replace_existing=True
     )
     
+    # Item activity counter repair nightly at 3:00 AM
+    scheduler.add_job(
+        repair_counters,
+        trigger=CronTrigger(hour=3, minute=0),
+        id='repair_item_counters',
+        name='Repair Item Counters',
+        replace_existing=True
+    )
+    
+    # Unread notification counter reconciliation nightly at 3:30 AM
+    scheduler.add_job(
+        reconcile_unread_notifications,
+        trigger=CronTrigger(hour=3, minute=30),
+        id='reconcile_unread_counts',
+        name='Reconcile Unread Notification Counters',
+        replace_existing=True
+    )
+    
+    # Notification retention nightly at 4:00 AM
+    scheduler.add_job(
+        purge_notifications,
+        trigger=CronTrigger(hour=4, minute=0),
+        id='purge_notifications',
+        name='Purge Old Notifications',
+        replace_existing=True
+    )
+    
     scheduler.start()
     logger.info("Scheduler started with autopilot jobs")
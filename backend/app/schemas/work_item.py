@@ -1,8 +1,10 @@
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional, List
 from enum import Enum
 from decimal import Decimal
+from app.schemas.attachment import Attachment
+from app.schemas.time_entry import TimeStats
 
 class ItemType(str, Enum):
     SUPPORT = "support"
@@ -59,10 +61,46 @@ class WorkItem(WorkItemBase):
     completed_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
+    comment_count: int = 0
+    attachment_count: int = 0
+    total_logged_hours: Decimal = Decimal("0")
+    last_activity_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
 
+class WorkItemPage(BaseModel):
+    items: List[WorkItem]
+    next_cursor: Optional[str] = None
+
+class WorkItemChanges(BaseModel):
+    items: List[WorkItem]
+    deleted: List[int] = []
+    cursor: str
+    has_more: bool = False
+
+class WorkItemBulkUpdate(BaseModel):
+    ids: List[int]
+    status: Optional[ItemStatus] = None
+    priority: Optional[ItemPriority] = None
+    assignee_id: Optional[int] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    due_at: Optional[datetime] = None
+
+class BulkItemResult(BaseModel):
+    id: int
+    success: bool
+    detail: Optional[str] = None
+    item: Optional[WorkItem] = None
+
+class WorkItemBulkResult(BaseModel):
+    updated: int
+    results: List[BulkItemResult]
+
+class WorkItemSearchHit(WorkItem):
+    score: float
+
 class WorkItemAssign(BaseModel):
     assignee_id: int
 
@@ -83,3 +121,55 @@ class Comment(CommentBase):
 
 class WorkItemWithComments(WorkItem):
     comments: List[Comment] = []
+
+class CommentWithAuthor(Comment):
+    user_name: Optional[str] = None
+    user_role: Optional[str] = None
+
+class CommentPage(BaseModel):
+    items: List[CommentWithAuthor]
+    next_cursor: Optional[str] = None
+
+class BundleUser(BaseModel):
+    id: int
+    name: str
+    email: str
+    role: str
+    branch_id: Optional[int] = None
+    
+    class Config:
+        from_attributes = True
+
+class WorkItemBundle(BaseModel):
+    """Everything the ticket detail page needs in one response"""
+    item: WorkItem
+    comments: List[CommentWithAuthor] = []
+    attachments: List[Attachment] = []
+    time_stats: TimeStats
+    users: List[BundleUser] = []
+
+class StatusTypePriorityCount(BaseModel):
+    status: ItemStatus
+    type: ItemType
+    priority: Optional[ItemPriority] = None
+    count: int
+
+class GroupCount(BaseModel):
+    id: Optional[int] = None
+    name: Optional[str] = None
+    count: int
+
+class DailyCount(BaseModel):
+    date: date
+    count: int
+
+class WorkItemStats(BaseModel):
+    """Grouped counts for the board and dashboard, computed in the database"""
+    total: int
+    open: int
+    overdue: int
+    by_status_type_priority: List[StatusTypePriorityCount] = []
+    open_by_branch: List[GroupCount] = []
+    open_by_assignee: List[GroupCount] = []
+    created_per_day: List[DailyCount] = []
+    closed_per_day: List[DailyCount] = []
@@ -0,0 +1,54 @@
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Optional, Type
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+import msgpack
+import orjson
+
+from app.streaming import json_default
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+class ORJSONResponse(Response):
+    """JSON response rendered by orjson, encoding Decimal the way Pydantic does (as a string)"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+class MsgpackResponse(Response):
+    """msgpack response; datetimes and decimals are sent as strings like in JSON"""
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=json_default, datetime=False)
+
+def wants_msgpack(request: Optional[Request]) -> bool:
+    accept = request.headers.get("accept", "") if request is not None else ""
+    return any(media_type in accept for media_type in MSGPACK_MEDIA_TYPES)
+
+def fast_response(request: Optional[Request], content: Any) -> Response:
+    """Render already-serialized content as msgpack if the client asks for it, else orjson"""
+    response_class = MsgpackResponse if wants_msgpack(request) else ORJSONResponse
+    response = response_class(content)
+    response.headers["Vary"] = "Accept"
+    return response
+
+@lru_cache(maxsize=64)
+def row_serializer(schema: Type[BaseModel], exclude: tuple = ()) -> Callable[[Any], dict]:
+    """Build a function turning a trusted ORM object into a dict with schema's fields
+
+    Skips Pydantic validation: use it only on rows loaded from our own tables,
+    whose column types already match the schema.
+    """
+    names = tuple(name for name in schema.model_fields if name not in exclude)
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        return lambda obj: {names[0]: getter(obj)}
+    return lambda obj: dict(zip(names, getter(obj)))
+
+def serialize_rows(schema: Type[BaseModel], rows: Iterable[Any], exclude: tuple = ()) -> List[dict]:
+    serialize = row_serializer(schema, exclude)
+    return [serialize(row) for row in rows]
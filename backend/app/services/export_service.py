@@ -0,0 +1,109 @@
+from sqlalchemy.orm import Query, Session, aliased
+from typing import Iterator
+import csv
+import io
+import itertools
+
+from app.models.branch import Branch
+from app.models.item_comment import ItemComment
+from app.models.user import User
+from app.models.work_item import WorkItem
+from app.streaming import STREAM_BATCH_SIZE
+
+TICKET_FIELDS = [
+    "id", "title", "type", "priority", "status", "assignee", "reporter", "branch",
+    "start_date", "end_date", "due_at", "completed_at", "created_at", "updated_at",
+    "sla_hours", "description"
+]
+COMMENT_FIELDS = ["comment_id", "comment_created_at", "comment_user", "comment_body"]
+
+def export_columns(db: Session) -> Query:
+    """Ticket rows left-joined with their comments and the names they reference"""
+    assignee = aliased(User)
+    reporter = aliased(User)
+    commenter = aliased(User)
+    return db.query(
+        WorkItem.id,
+        WorkItem.title,
+        WorkItem.type,
+        WorkItem.priority,
+        WorkItem.status,
+        assignee.name.label("assignee"),
+        reporter.name.label("reporter"),
+        Branch.name.label("branch"),
+        WorkItem.start_date,
+        WorkItem.end_date,
+        WorkItem.due_at,
+        WorkItem.completed_at,
+        WorkItem.created_at,
+        WorkItem.updated_at,
+        WorkItem.sla_hours,
+        WorkItem.description,
+        ItemComment.id.label("comment_id"),
+        ItemComment.created_at.label("comment_created_at"),
+        commenter.name.label("comment_user"),
+        ItemComment.body.label("comment_body")
+    ).outerjoin(
+        assignee, assignee.id == WorkItem.assignee_id
+    ).outerjoin(
+        reporter, reporter.id == WorkItem.reporter_id
+    ).outerjoin(
+        Branch, Branch.id == WorkItem.branch_id
+    ).outerjoin(
+        ItemComment, ItemComment.item_id == WorkItem.id
+    ).outerjoin(
+        commenter, commenter.id == ItemComment.user_id
+    )
+
+def stream_export_rows(query: Query) -> Iterator[dict]:
+    """One dict per (ticket, comment), ordered by ticket, read from a server-side cursor"""
+    query = query.order_by(WorkItem.id, ItemComment.created_at, ItemComment.id).yield_per(STREAM_BATCH_SIZE)
+    for row in query:
+        yield row._asdict()
+
+def group_tickets(rows: Iterator[dict]) -> Iterator[dict]:
+    """Fold consecutive rows of the same ticket into one ticket with a comments list"""
+    for _, ticket_rows in itertools.groupby(rows, key=lambda row: row["id"]):
+        first = next(ticket_rows)
+        ticket = {field: first[field] for field in TICKET_FIELDS}
+        ticket["comments"] = [
+            {
+                "id": row["comment_id"],
+                "created_at": row["comment_created_at"],
+                "user": row["comment_user"],
+                "body": row["comment_body"]
+            }
+            for row in itertools.chain([first], ticket_rows)
+            if row["comment_id"] is not None
+        ]
+        yield ticket
+
+def csv_chunks(rows: Iterator[dict], batch_size: int = STREAM_BATCH_SIZE) -> Iterator[bytes]:
+    """Serialize export rows as CSV, flushing a chunk every batch_size rows"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(TICKET_FIELDS + COMMENT_FIELDS)
+    for count, row in enumerate(rows, 1):
+        writer.writerow([row[field] for field in TICKET_FIELDS + COMMENT_FIELDS])
+        if count % batch_size == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+def write_xlsx(rows: Iterator[dict], path: str):
+    """Write export rows to an xlsx file with openpyxl's constant-memory writer"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Tickets")
+    sheet.append(TICKET_FIELDS + COMMENT_FIELDS)
+    for row in rows:
+        sheet.append([_xlsx_value(row[field]) for field in TICKET_FIELDS + COMMENT_FIELDS])
+    workbook.save(path)
+
+def _xlsx_value(value):
+    # Excel has no timezone support
+    if hasattr(value, "tzinfo") and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
@@ -0,0 +1,13 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.models.work_item_tombstone import WorkItemTombstone
+from app.services.table_version_service import next_table_version
+
+def next_change_seq(db: Session) -> int:
+    """Change sequence for a write to work_items (also invalidates their ETags)"""
+    return next_table_version(db, "work_items")
+
+def record_item_removal(db: Session, item_id: int, branch_id: Optional[int], change_seq: int):
+    """Tombstone an item for clients syncing the branch it left"""
+    db.add(WorkItemTombstone(item_id=item_id, branch_id=branch_id, change_seq=change_seq))
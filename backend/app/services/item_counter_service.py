@@ -0,0 +1,111 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from datetime import datetime, timezone
+from decimal import Decimal
+import logging
+
+from app.models.work_item import WorkItem
+from app.models.item_comment import ItemComment
+from app.models.attachment import Attachment
+from app.models.time_entry import TimeEntry
+from app.services.item_change_service import next_change_seq
+
+logger = logging.getLogger(__name__)
+
+REPAIR_BATCH_SIZE = 500
+
+def bump_item_counters(db: Session, item_id: int, comments: int = 0, attachments: int = 0, hours=0):
+    """Adjust an item's activity counters in the caller's transaction
+
+    Increments are applied in SQL so concurrent writers never lose updates.
+    updated_at is left alone: it tracks edits to the item itself.
+
+    Call this before adding the child row. Flushing a child INSERT takes a
+    shared lock on the item through its foreign key; bumping first keeps
+    the lock order of update_item (work_items version row, then item row)
+    so the two cannot deadlock on MySQL.
+    """
+    db.query(WorkItem).filter(WorkItem.id == item_id).update({
+        "comment_count": WorkItem.comment_count + comments,
+        "attachment_count": WorkItem.attachment_count + attachments,
+        "total_logged_hours": WorkItem.total_logged_hours + Decimal(str(hours)),
+        "last_activity_at": datetime.now(timezone.utc),
+        "change_seq": next_change_seq(db),
+        "updated_at": WorkItem.updated_at
+    }, synchronize_session=False)
+
+def repair_item_counters(db: Session, batch_size: int = REPAIR_BATCH_SIZE) -> int:
+    """Recompute every item's counters from the source tables, one id range at a time
+
+    Counts and hours are overwritten; last_activity_at only moves forward,
+    since deletions leave nothing to recompute it from. Returns the number
+    of items corrected.
+    """
+    repaired = 0
+    last_id = 0
+    while True:
+        items = db.query(
+            WorkItem.id, WorkItem.comment_count, WorkItem.attachment_count,
+            WorkItem.total_logged_hours, WorkItem.last_activity_at, WorkItem.updated_at
+        ).filter(WorkItem.id > last_id).order_by(WorkItem.id).limit(batch_size).all()
+        if not items:
+            break
+        ids = [item.id for item in items]
+        last_id = ids[-1]
+
+        comments = dict(db.query(ItemComment.item_id, func.count(ItemComment.id)).filter(
+            ItemComment.item_id.in_(ids)
+        ).group_by(ItemComment.item_id).all())
+        attachments = dict(db.query(Attachment.work_item_id, func.count(Attachment.id)).filter(
+            Attachment.work_item_id.in_(ids)
+        ).group_by(Attachment.work_item_id).all())
+        hours = dict(db.query(TimeEntry.work_item_id, func.sum(TimeEntry.hours)).filter(
+            TimeEntry.work_item_id.in_(ids)
+        ).group_by(TimeEntry.work_item_id).all())
+        latest = {}
+        for column, item_column in (
+            (ItemComment.created_at, ItemComment.item_id),
+            (Attachment.created_at, Attachment.work_item_id),
+            (TimeEntry.updated_at, TimeEntry.work_item_id),
+        ):
+            for item_id, value in db.query(item_column, func.max(column)).filter(
+                item_column.in_(ids)
+            ).group_by(item_column):
+                if value is not None:
+                    latest[item_id] = max(_aware(value), latest.get(item_id, _aware(value)))
+
+        updates = []
+        for item in items:
+            expected = {
+                "comment_count": comments.get(item.id, 0),
+                "attachment_count": attachments.get(item.id, 0),
+                "total_logged_hours": Decimal(hours.get(item.id) or 0),
+            }
+            candidates = [_aware(value) for value in (item.last_activity_at, item.updated_at, latest.get(item.id)) if value is not None]
+            last_activity_at = max(candidates) if candidates else None
+            if (
+                item.comment_count != expected["comment_count"]
+                or item.attachment_count != expected["attachment_count"]
+                or Decimal(item.total_logged_hours or 0) != expected["total_logged_hours"]
+                or (last_activity_at is not None and _aware(item.last_activity_at) != last_activity_at)
+            ):
+                updates.append({"id": item.id, "last_activity_at": last_activity_at, **expected})
+
+        if updates:
+            change_seq = next_change_seq(db)
+            for values in updates:
+                db.query(WorkItem).filter(WorkItem.id == values.pop("id")).update(
+                    {**values, "change_seq": change_seq, "updated_at": WorkItem.updated_at},
+                    synchronize_session=False
+                )
+            repaired += len(updates)
+        db.commit()
+
+    logger.info(f"Repaired activity counters on {repaired} items")
+    return repaired
+
+def _aware(value):
+    # SQLite and some MySQL drivers return naive datetimes for UTC columns
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
@@ -0,0 +1,185 @@
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import logging
+import os
+import time
+
+from app.models.notification_outbox import NotificationOutbox
+from app.models.user import User
+from app.schemas.notification import NotificationType
+from app.events import publish_notification_event
+from app.notifications.email_service import email_configured, send_email
+from app.notifications.slack_service import slack_configured, send_slack_message
+from app.services.notification_service import fan_out_notifications
+from app.services.preference_cache_service import get_cached_preferences
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = int(os.getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", "200"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", "5"))
+# First retry delay; doubles with every failed attempt
+OUTBOX_RETRY_SECONDS = int(os.getenv("NOTIFICATION_OUTBOX_RETRY_SECONDS", "30"))
+# How long claimed email / Slack rows stay hidden from other workers while
+# being sent; rows of a crashed worker are retried once it runs out
+OUTBOX_LEASE_SECONDS = int(os.getenv("NOTIFICATION_OUTBOX_LEASE_SECONDS", "300"))
+
+def drain_outbox(db: Session, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+    """Process one batch of due outbox rows per channel; returns the rows handled"""
+    return drain_in_app(db, batch_size) + drain_deliveries(db, batch_size)
+
+def _claim(db: Session, channels, batch_size: int) -> list:
+    # SKIP LOCKED lets every uvicorn worker drain the outbox without
+    # picking up rows another worker is already handling
+    return db.query(NotificationOutbox).filter(
+        NotificationOutbox.channel.in_(channels),
+        NotificationOutbox.status == "pending",
+        NotificationOutbox.next_attempt_at <= datetime.now(timezone.utc)
+    ).order_by(NotificationOutbox.id).limit(batch_size).with_for_update(skip_locked=True).all()
+
+def drain_in_app(db: Session, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+    """Expand in-app rows to one notification per recipient and insert them all at once
+
+    The notifications and the removal of their outbox rows commit together,
+    so a crash never creates a notification twice or loses one. If the batch
+    fails, its entries are retried one at a time so only the bad entry is
+    rescheduled (and eventually marked failed).
+    """
+    entries = _claim(db, ["in_app"], batch_size)
+    if not entries:
+        return 0
+    entry_ids = [entry.id for entry in entries]
+
+    try:
+        rows = _create_in_app(db, entries)
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Batch of {len(entry_ids)} in-app outbox entries failed, retrying one at a time: {e}")
+        rows = []
+        for entry_id in entry_ids:
+            rows.extend(_drain_in_app_entry(db, entry_id))
+
+    for row in rows:
+        publish_notification_event(row)
+    logger.info(f"Created {len(rows)} notifications from {len(entry_ids)} outbox entries")
+    return len(entry_ids)
+
+def _create_in_app(db: Session, entries: list) -> list:
+    notifications = [
+        {
+            "user_id": user_id,
+            "type": NotificationType(entry.payload["type"]),
+            "title": entry.payload["title"],
+            "message": entry.payload["message"],
+            "ticket_id": entry.payload.get("ticket_id"),
+            "related_user_id": entry.payload.get("related_user_id"),
+            "origin": entry.payload.get("origin")
+        }
+        for entry in entries
+        for user_id in entry.payload["user_ids"]
+    ]
+    rows = fan_out_notifications(db, notifications)
+    for entry in entries:
+        db.delete(entry)
+    db.commit()
+    return rows
+
+def _drain_in_app_entry(db: Session, entry_id: int) -> list:
+    # Re-claim the entry: its lock was released with the failed batch
+    entry = db.query(NotificationOutbox).filter(
+        NotificationOutbox.id == entry_id,
+        NotificationOutbox.status == "pending"
+    ).with_for_update(skip_locked=True).first()
+    if entry is None:
+        db.rollback()
+        return []
+    try:
+        return _create_in_app(db, [entry])
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to create notifications from outbox entry {entry_id}: {e}")
+        _schedule_retry(db, [entry_id], e)
+        return []
+
+def drain_deliveries(db: Session, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+    """Send queued email and Slack messages, retrying failures with backoff
+    
+    The batch is leased in one short transaction (next_attempt_at pushed past
+    the lease) and sent with no transaction or row locks open; each result is
+    then recorded in its own commit, so a crash re-sends at most the message
+    in flight. Rows not reached before half the lease has passed are left
+    for the lease to expire rather than risk another worker sending them too.
+    """
+    entries = _claim(db, ["email", "slack"], batch_size)
+    if not entries:
+        return 0
+    leased_at = time.monotonic()
+    lease_until = datetime.now(timezone.utc) + timedelta(seconds=OUTBOX_LEASE_SECONDS)
+    for entry in entries:
+        entry.next_attempt_at = lease_until
+    batch = [(entry.id, entry.channel, entry.payload) for entry in entries]
+    emails = _recipient_emails(db, [payload["user_id"] for entry_id, channel, payload in batch if channel == "email"])
+    db.commit()
+    
+    for entry_id, channel, payload in batch:
+        if time.monotonic() - leased_at > OUTBOX_LEASE_SECONDS / 2:
+            break
+        try:
+            sent = _deliver_email(payload, emails.get(payload["user_id"])) if channel == "email" else _deliver_slack(payload)
+            error = None if sent else f"{channel} delivery failed"
+        except Exception as e:
+            error = str(e)
+        
+        entry = db.get(NotificationOutbox, entry_id)
+        if entry is not None:
+            if error is None:
+                db.delete(entry)
+            else:
+                _record_failure(entry, error)
+            db.commit()
+    return len(batch)
+
+def _recipient_emails(db: Session, user_ids: list) -> dict:
+    if not user_ids:
+        return {}
+    return dict(db.query(User.id, User.email).filter(User.id.in_(set(user_ids))).all())
+
+def _deliver_email(payload: dict, email: Optional[str]) -> bool:
+    """Send one queued email, honouring the recipient's email and quiet-hour preferences"""
+    user_id = payload["user_id"]
+    prefs = get_cached_preferences(user_id)
+    # Check if user wants email for this type
+    if not getattr(prefs, f"email_{payload['type']}", True):
+        return True
+    # Check quiet hours
+    if prefs.quiet_hours_start and prefs.quiet_hours_end:
+        current_hour = datetime.now(timezone.utc).hour
+        if prefs.quiet_hours_start <= current_hour < prefs.quiet_hours_end:
+            logger.info(f"Skipping email for user {user_id} - quiet hours")
+            return True
+
+    if not email:
+        return True
+    if not email_configured():
+        logger.info(f"Email would be sent to {email}: {payload['subject']}")
+        return True
+    return send_email(email, payload["subject"], payload["body"])
+
+def _deliver_slack(payload: dict) -> bool:
+    if not slack_configured():
+        return True
+    return send_slack_message(payload["text"], payload.get("channel"))
+
+def _record_failure(entry: NotificationOutbox, error: str):
+    entry.attempts += 1
+    entry.last_error = error
+    if entry.attempts >= OUTBOX_MAX_ATTEMPTS:
+        entry.status = "failed"
+        logger.error(f"Giving up on outbox entry {entry.id} after {entry.attempts} attempts: {error}")
+    else:
+        entry.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=OUTBOX_RETRY_SECONDS * 2 ** (entry.attempts - 1))
+
+def _schedule_retry(db: Session, entry_ids: list, error: Exception):
+    for entry in db.query(NotificationOutbox).filter(NotificationOutbox.id.in_(entry_ids)):
+        _record_failure(entry, str(error))
+    db.commit()
@@ -0,0 +1,105 @@
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+import logging
+import os
+import time
+
+from app.models.notification import Notification
+from app.models.notification_archive import NotificationArchive
+
+logger = logging.getLogger(__name__)
+
+# Read notifications older than this are purged
+NOTIFICATION_RETENTION_DAYS = int(os.getenv("NOTIFICATION_RETENTION_DAYS", "90"))
+# Copy purged rows to notifications_archive instead of dropping them
+NOTIFICATION_RETENTION_ARCHIVE = os.getenv("NOTIFICATION_RETENTION_ARCHIVE", "false").lower() == "true"
+# Rows per transaction; each batch only locks its own primary keys
+NOTIFICATION_RETENTION_BATCH_SIZE = int(os.getenv("NOTIFICATION_RETENTION_BATCH_SIZE", "1000"))
+# Pause between batches so replication and live writes keep up
+NOTIFICATION_RETENTION_PAUSE_SECONDS = float(os.getenv("NOTIFICATION_RETENTION_PAUSE_SECONDS", "0.1"))
+# Stop a run after this long; the next run picks up where it left off
+NOTIFICATION_RETENTION_MAX_SECONDS = float(os.getenv("NOTIFICATION_RETENTION_MAX_SECONDS", "600"))
+# Rebuild the table after a run (InnoDB OPTIMIZE is online, MySQL only)
+NOTIFICATION_RETENTION_OPTIMIZE = os.getenv("NOTIFICATION_RETENTION_OPTIMIZE", "false").lower() == "true"
+
+ARCHIVE_COLUMNS = [
+    "id", "user_id", "type", "title", "message", "ticket_id",
+    "related_user_id", "is_read", "read_at", "created_at"
+]
+
+def purge_read_notifications(
+    db: Session,
+    older_than_days: int = NOTIFICATION_RETENTION_DAYS,
+    archive: bool = NOTIFICATION_RETENTION_ARCHIVE,
+    batch_size: int = NOTIFICATION_RETENTION_BATCH_SIZE,
+    pause_seconds: float = NOTIFICATION_RETENTION_PAUSE_SECONDS,
+    max_seconds: float = NOTIFICATION_RETENTION_MAX_SECONDS
+) -> dict:
+    """Delete (or archive, then delete) read notifications older than the retention age
+
+    Walks the matching ids in primary key order and removes them one batch
+    per transaction, so no statement holds locks on more than batch_size rows
+    and the live table stays writable throughout. Unread notifications are
+    never touched, so the unread counters need no adjustment. Returns what
+    was purged and how long it took.
+    """
+    started = time.monotonic()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    purged = 0
+    batches = 0
+    last_id = 0
+    finished = True
+
+    while True:
+        if time.monotonic() - started > max_seconds:
+            finished = False
+            break
+        ids = list(db.execute(select(Notification.id).where(
+            Notification.is_read == True,
+            Notification.created_at < cutoff,
+            Notification.id > last_id
+        ).order_by(Notification.id).limit(batch_size)).scalars())
+        if not ids:
+            break
+        last_id = ids[-1]
+
+        try:
+            if archive:
+                columns = [getattr(Notification, name) for name in ARCHIVE_COLUMNS]
+                db.execute(insert(NotificationArchive).from_select(
+                    ARCHIVE_COLUMNS, select(*columns).where(Notification.id.in_(ids))
+                ))
+            result = db.execute(delete(Notification).where(Notification.id.in_(ids)))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        purged += result.rowcount
+        batches += 1
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    report = {
+        "purged": purged,
+        "archived": purged if archive else 0,
+        "batches": batches,
+        "cutoff": cutoff.isoformat(),
+        "seconds": round(time.monotonic() - started, 2),
+        "finished": finished
+    }
+    logger.info(
+        f"Notification retention: purged {purged} read notifications older than "
+        f"{older_than_days} days in {batches} batches, {report['seconds']}s"
+        + ("" if finished else " (time limit reached, resuming next run)")
+    )
+    return report
+
+def optimize_notifications_table(db: Session):
+    """Reclaim the space freed by purging (MySQL only, online rebuild for InnoDB)"""
+    if db.get_bind().dialect.name != "mysql":
+        return
+    started = time.monotonic()
+    db.execute(text("OPTIMIZE TABLE notifications"))
+    db.commit()
+    logger.info(f"Optimized notifications table in {time.monotonic() - started:.2f}s")
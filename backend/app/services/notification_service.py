@@ -1,185 +1,241 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
 from app.models.notification import Notification, NotificationPreference
-from app.models.user import User
-from app.schemas.notification import NotificationType
+from app.models.notification_outbox import NotificationOutbox
+from app.schemas.notification import NotificationType, Notification as NotificationSchema
+from app.events import publish_notification_event
+from app.rows import read_rows, schema_columns
+from app.services.preference_cache_service import get_cached_preferences_for
+from app.services.unread_count_service import decrement_unread_count, increment_unread_counts
+from app.services.unread_count_service import get_unread_count as get_counted_unread
+from bisect import bisect_left
+from collections import Counter
+from contextlib import nullcontext
 from datetime import datetime, timezone
+from threading import Lock
 from typing import Optional
 import logging
+import uuid
 
 logger = logging.getLogger(__name__)
 
-def create_notification(
+# Upper bounds of the notifications-per-request histogram
+FAN_OUT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+
+class FanOutMetrics:
+    """Notifications created per originating request, counted in this process"""
+    
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.notifications = 0
+            self.max_per_request = 0
+            self.buckets = [0] * (len(FAN_OUT_BUCKETS) + 1)
+    
+    def record(self, created: int):
+        with self._lock:
+            self.requests += 1
+            self.notifications += created
+            self.max_per_request = max(self.max_per_request, created)
+            self.buckets[bisect_left(FAN_OUT_BUCKETS, created)] += 1
+    
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [str(bound) for bound in FAN_OUT_BUCKETS] + ["+Inf"]
+            return {
+                "requests": self.requests,
+                "notifications_created": self.notifications,
+                "mean_per_request": round(self.notifications / self.requests, 2) if self.requests else 0,
+                "max_per_request": self.max_per_request,
+                "per_request_histogram": dict(zip(labels, self.buckets))
+            }
+
+fan_out_metrics = FanOutMetrics()
+
+def fan_out_notifications(db: Session, notifications: list) -> list:
+    """Insert in-app notifications for many recipients at once, without committing
+    
+    Each entry is a dict with user_id, type, title, message and optional
+    ticket_id / related_user_id / origin. Every recipient's preferences are
+    read from the preference cache and the allowed rows go out as one multi-row INSERT
+    inside a savepoint, together with the recipients' unread counters: on
+    failure only the notifications are rolled back and the error is raised,
+    leaving the caller's transaction usable. Returns the inserted rows.
+    """
+    if not notifications:
+        return []
+    
+    # Served from the preference cache; users without a row get the defaults
+    prefs_by_user = get_cached_preferences_for({n["user_id"] for n in notifications})
+    
+    rows = []
+    created = {}
+    for n in notifications:
+        created.setdefault(n.get("origin"), 0)
+        if not getattr(prefs_by_user[n["user_id"]], f"app_{n['type'].value}", True):
+            continue
+        created[n.get("origin")] += 1
+        rows.append({
+            "user_id": n["user_id"],
+            "type": n["type"].value,
+            "title": n["title"],
+            "message": n["message"],
+            "ticket_id": n.get("ticket_id"),
+            "related_user_id": n.get("related_user_id"),
+            "is_read": False
+        })
+    
+    if rows:
+        # pysqlite mishandles SAVEPOINT; on SQLite (development only) rely on
+        # the single INSERT statement being atomic instead
+        with db.begin_nested() if db.get_bind().dialect.name != "sqlite" else nullcontext():
+            db.execute(insert(Notification), rows)
+            increment_unread_counts(db, Counter(row["user_id"] for row in rows))
+    
+    for count in created.values():
+        fan_out_metrics.record(count)
+    return rows
+
+def create_notifications(db: Session, notifications: list) -> int:
+    """Fan notifications out and commit them in one transaction
+    
+    Takes the same entries as fan_out_notifications and commits the caller's
+    session once. A failed insert is logged and skipped; it never rolls back
+    the caller's other changes. Returns the number of notifications created.
+    """
+    try:
+        rows = fan_out_notifications(db, notifications)
+    except Exception as e:
+        logger.error(f"Failed to create notifications: {e}")
+        return 0
+    
+    db.commit()
+    for row in rows:
+        publish_notification_event(row)
+    logger.info(f"Created {len(rows)} notifications in one batch")
+    return len(rows)
+
+def enqueue_notification(
     db: Session,
-    user_id: int,
     type: NotificationType,
+    user_ids: list,
     title: str,
     message: str,
     ticket_id: Optional[int] = None,
-    related_user_id: Optional[int] = None
+    related_user_id: Optional[int] = None,
+    email_subject: Optional[str] = None,
+    email_body: Optional[str] = None,
+    slack_text: Optional[str] = None
 ):
-    """Create an in-app notification"""
-    try:
-        # Check user preferences
-        prefs = get_or_create_preferences(db, user_id)
-        
-        # Check if user wants this type of notification
-        pref_key = f"app_{type.value}"
-        if not getattr(prefs, pref_key, True):
-            return None
-        
-        # Create notification
-        notification = Notification(
-            user_id=user_id,
-            type=type.value,
-            title=title,
-            message=message,
-            ticket_id=ticket_id,
-            related_user_id=related_user_id
+    """Queue a notification in the caller's transaction
+    
+    Nothing is sent here: the rows are committed with the caller's change and
+    the outbox worker creates the in-app notifications and sends email / Slack
+    afterwards. One email row is queued per recipient so each retries alone.
+    """
+    recipients = list(dict.fromkeys(user_id for user_id in user_ids if user_id is not None))
+    now = datetime.now(timezone.utc)
+    rows = []
+    if recipients:
+        rows.append(NotificationOutbox(channel="in_app", next_attempt_at=now, payload={
+            "origin": _origin(db),
+            "user_ids": recipients,
+            "type": type.value,
+            "title": title,
+            "message": message,
+            "ticket_id": ticket_id,
+            "related_user_id": related_user_id
+        }))
+    if email_subject:
+        rows.extend(
+            NotificationOutbox(channel="email", next_attempt_at=now, payload={
+                "user_id": user_id,
+                "type": type.value,
+                "subject": email_subject,
+                "body": email_body or message,
+                "ticket_id": ticket_id
+            })
+            for user_id in recipients
         )
-        
-        db.add(notification)
-        db.commit()
-        db.refresh(notification)
-        
-        logger.info(f"Created notification {notification.id} for user {user_id}")
-        return notification
-        
-    except Exception as e:
-        logger.error(f"Failed to create notification: {e}")
-        db.rollback()
-        return None
+    if slack_text:
+        rows.append(NotificationOutbox(channel="slack", next_attempt_at=now, payload={"text": slack_text}))
+    
+    db.add_all(rows)
+    # Lets the outbox worker start draining as soon as this session commits
+    db.info["notification_outbox"] = True
 
-def send_email_notification(
-    db: Session,
-    user_id: int,
-    type: NotificationType,
-    subject: str,
-    body: str,
-    ticket_id: Optional[int] = None
-):
-    """Send email notification (placeholder for actual email service)"""
-    try:
-        # Check user preferences
-        prefs = get_or_create_preferences(db, user_id)
-        
-        # Check if user wants email for this type
-        pref_key = f"email_{type.value}"
-        if not getattr(prefs, pref_key, True):
-            return False
-        
-        # Check quiet hours
-        if prefs.quiet_hours_start and prefs.quiet_hours_end:
-            current_hour = datetime.now(timezone.utc).hour
-            if prefs.quiet_hours_start <= current_hour < prefs.quiet_hours_end:
-                logger.info(f"Skipping email for user {user_id} - quiet hours")
-                return False
-        
-        # Get user email
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return False
-        
-        # TODO: Implement actual email sending here
-        # For now, just log it
-        logger.info(f"Email would be sent to {user.email}: {subject}")
-        
-        # Example using email service:
-        # from app.notifications.email_service import send_email
-        # send_email(
-        #     to=user.email,
-        #     subject=subject,
-        #     body=body
-        # )
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Failed to send email notification: {e}")
-        return False
+def _origin(db: Session) -> str:
+    # Request sessions live for one request, so this groups the outbox rows
+    # one request queued for the notifications-per-request metric
+    return db.info.setdefault("notification_origin", uuid.uuid4().hex)
 
 def notify_ticket_assigned(db: Session, ticket_id: int, assignee_id: int, assigner_id: int):
     """Notify when ticket is assigned"""
-    create_notification(
-        db=db,
-        user_id=assignee_id,
-        type=NotificationType.TICKET_ASSIGNED,
+    enqueue_notification(
+        db,
+        NotificationType.TICKET_ASSIGNED,
+        [assignee_id],
         title="New Ticket Assigned",
         message=f"You have been assigned to ticket #{ticket_id}",
         ticket_id=ticket_id,
-        related_user_id=assigner_id
-    )
-    
-    send_email_notification(
-        db=db,
-        user_id=assignee_id,
-        type=NotificationType.TICKET_ASSIGNED,
-        subject=f"New Ticket Assigned: #{ticket_id}",
-        body=f"You have been assigned to ticket #{ticket_id}",
-        ticket_id=ticket_id
+        related_user_id=assigner_id,
+        email_subject=f"New Ticket Assigned: #{ticket_id}",
+        email_body=f"You have been assigned to ticket #{ticket_id}"
     )
 
 def notify_ticket_updated(db: Session, ticket_id: int, user_ids: list, updater_id: int):
     """Notify when ticket is updated"""
-    for user_id in user_ids:
-        if user_id != updater_id:  # Don't notify the person who made the change
-            create_notification(
-                db=db,
-                user_id=user_id,
-                type=NotificationType.TICKET_UPDATED,
-                title="Ticket Updated",
-                message=f"Ticket #{ticket_id} has been updated",
-                ticket_id=ticket_id,
-                related_user_id=updater_id
-            )
+    enqueue_notification(
+        db,
+        NotificationType.TICKET_UPDATED,
+        [user_id for user_id in user_ids if user_id != updater_id],  # Don't notify the person who made the change
+        title="Ticket Updated",
+        message=f"Ticket #{ticket_id} has been updated",
+        ticket_id=ticket_id,
+        related_user_id=updater_id
+    )
 
 def notify_ticket_commented(db: Session, ticket_id: int, user_ids: list, commenter_id: int):
     """Notify when comment is added"""
-    for user_id in user_ids:
-        if user_id != commenter_id:
-            create_notification(
-                db=db,
-                user_id=user_id,
-                type=NotificationType.TICKET_COMMENTED,
-                title="New Comment",
-                message=f"New comment on ticket #{ticket_id}",
-                ticket_id=ticket_id,
-                related_user_id=commenter_id
-            )
+    enqueue_notification(
+        db,
+        NotificationType.TICKET_COMMENTED,
+        [user_id for user_id in user_ids if user_id != commenter_id],
+        title="New Comment",
+        message=f"New comment on ticket #{ticket_id}",
+        ticket_id=ticket_id,
+        related_user_id=commenter_id
+    )
 
 def notify_ticket_reopened(db: Session, ticket_id: int, assignee_id: int, requester_id: int):
     """Notify when ticket is reopened"""
-    create_notification(
-        db=db,
-        user_id=assignee_id,
-        type=NotificationType.TICKET_REOPENED,
+    enqueue_notification(
+        db,
+        NotificationType.TICKET_REOPENED,
+        [assignee_id],
         title="Ticket Reopened",
         message=f"Ticket #{ticket_id} has been reopened",
         ticket_id=ticket_id,
-        related_user_id=requester_id
-    )
-    
-    send_email_notification(
-        db=db,
-        user_id=assignee_id,
-        type=NotificationType.TICKET_REOPENED,
-        subject=f"Ticket Reopened: #{ticket_id}",
-        body=f"Ticket #{ticket_id} has been reopened by the requester",
-        ticket_id=ticket_id
+        related_user_id=requester_id,
+        email_subject=f"Ticket Reopened: #{ticket_id}",
+        email_body=f"Ticket #{ticket_id} has been reopened by the requester"
     )
 
 def notify_ticket_status_changed(db: Session, ticket_id: int, user_ids: list, changer_id: int, new_status: str):
     """Notify when ticket status changes"""
-    for user_id in user_ids:
-        if user_id != changer_id:
-            create_notification(
-                db=db,
-                user_id=user_id,
-                type=NotificationType.TICKET_STATUS_CHANGED,
-                title="Status Changed",
-                message=f"Ticket #{ticket_id} status changed to {new_status}",
-                ticket_id=ticket_id,
-                related_user_id=changer_id
-            )
+    enqueue_notification(
+        db,
+        NotificationType.TICKET_STATUS_CHANGED,
+        [user_id for user_id in user_ids if user_id != changer_id],
+        title="Status Changed",
+        message=f"Ticket #{ticket_id} status changed to {new_status}",
+        ticket_id=ticket_id,
+        related_user_id=changer_id
+    )
 
 def get_or_create_preferences(db: Session, user_id: int) -> NotificationPreference:
     """Get or create notification preferences for user"""
@@ -197,14 +253,19 @@ def get_or_create_preferences(db: Session, user_id: int) -> NotificationPreferen
 
 def mark_as_read(db: Session, notification_id: int, user_id: int):
     """Mark notification as read"""
-    notification = db.query(Notification).filter(
+    # Conditional UPDATE so two concurrent reads of the same notification
+    # only take it off the unread counter once
+    updated = db.query(Notification).filter(
         Notification.id == notification_id,
-        Notification.user_id == user_id
-    ).first()
+        Notification.user_id == user_id,
+        Notification.is_read == False
+    ).update({
+        "is_read": True,
+        "read_at": datetime.now(timezone.utc)
+    }, synchronize_session=False)
     
-    if notification and not notification.is_read:
-        notification.is_read = True
-        notification.read_at = datetime.now(timezone.utc)
+    if updated:
+        decrement_unread_count(db, user_id, updated)
         db.commit()
         return True
     
@@ -212,22 +273,29 @@ def mark_as_read(db: Session, notification_id: int, user_id: int):
 
 def mark_all_as_read(db: Session, user_id: int):
     """Mark all notifications as read for user"""
-    db.query(Notification).filter(
+    updated = db.query(Notification).filter(
         Notification.user_id == user_id,
         Notification.is_read == False
     ).update({
         "is_read": True,
         "read_at": datetime.now(timezone.utc)
     })
+    decrement_unread_count(db, user_id, updated)
     db.commit()
     return True
 
+def list_notifications(db: Session, user_id: int, skip: int = 0, limit: int = 50, unread_only: bool = False) -> list:
+    """A user's notifications, newest first, as read-only Core rows"""
+    query = select(*schema_columns(Notification, NotificationSchema)).where(Notification.user_id == user_id)
+    
+    if unread_only:
+        query = query.where(Notification.is_read == False)
+    
+    return read_rows(db, query.order_by(Notification.created_at.desc()).offset(skip).limit(limit))
+
 def get_unread_count(db: Session, user_id: int) -> int:
-    """Get count of unread notifications"""
-    return db.query(Notification).filter(
-        Notification.user_id == user_id,
-        Notification.is_read == False
-    ).count()
+    """Get count of unread notifications from the maintained per-user counter"""
+    return get_counted_unread(db, user_id)
 
 
 
@@ -4,6 +4,7 @@ from typing import Optional
 
 from app.models.user import User
 from app.models.oncall_roster import OncallRoster
+from app.services.table_version_service import bump_table_version
 
 def get_monday_of_week(target_date: date = None) -> date:
     """Get the Monday of the week for the given date"""
@@ -48,6 +49,7 @@ def seed_oncall_roster(user_ids: list[int], db: Session) -> bool:
         )
         db.add(roster_entry)
     
+    bump_table_version(db, "oncall_roster")
     db.commit()
     return True
 
@@ -0,0 +1,104 @@
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from threading import Lock
+from typing import Dict, List, Optional
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+
+from app.auth import verify_password, get_password_hash
+
+logger = logging.getLogger(__name__)
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+LOGIN_MAX_FAILED_ATTEMPTS = int(os.getenv("LOGIN_MAX_FAILED_ATTEMPTS", "5"))
+LOGIN_ATTEMPT_WINDOW_SECONDS = int(os.getenv("LOGIN_ATTEMPT_WINDOW_SECONDS", "300"))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = Lock()
+
+def _pool_context():
+    # The pool starts lazily, after the scheduler, outbox, event hub and
+    # threadpool threads are running; forking that process could leave a
+    # child holding a lock (logging, connection pool) that never gets
+    # released. Start workers from a clean forkserver (spawn where missing).
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+def get_password_pool() -> ProcessPoolExecutor:
+    """Get the bounded process pool used for bcrypt work"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, mp_context=_pool_context())
+                logger.info(f"Started password hashing pool with {PASSWORD_HASH_WORKERS} workers")
+    return _pool
+
+def shutdown_password_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the process pool without holding a request thread"""
+    future = get_password_pool().submit(verify_password, plain_password, hashed_password)
+    return await asyncio.wrap_future(future)
+
+async def hash_password_async(password: str) -> str:
+    future = get_password_pool().submit(get_password_hash, password)
+    return await asyncio.wrap_future(future)
+
+def hash_password(password: str) -> str:
+    """Hash a password in the process pool from sync code"""
+    return get_password_pool().submit(get_password_hash, password).result()
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    """Hash many passwords in parallel across the pool"""
+    return list(get_password_pool().map(get_password_hash, passwords))
+
+
+class LoginThrottle:
+    """Sliding-window limit on failed login attempts per account"""
+
+    def __init__(self, max_attempts: int, window_seconds: int):
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self._failures: Dict[str, deque] = {}
+        self._lock = Lock()
+
+    def _prune(self, attempts: deque, now: float):
+        while attempts and attempts[0] <= now - self.window_seconds:
+            attempts.popleft()
+
+    def retry_after(self, account: str) -> int:
+        """Seconds until the account may try again, or 0 if not throttled"""
+        now = time.monotonic()
+        with self._lock:
+            attempts = self._failures.get(account)
+            if not attempts:
+                return 0
+            self._prune(attempts, now)
+            if len(attempts) < self.max_attempts:
+                if not attempts:
+                    del self._failures[account]
+                return 0
+            return max(1, int(attempts[0] + self.window_seconds - now))
+
+    def record_failure(self, account: str):
+        now = time.monotonic()
+        with self._lock:
+            attempts = self._failures.setdefault(account, deque())
+            self._prune(attempts, now)
+            attempts.append(now)
+
+    def reset(self, account: str):
+        with self._lock:
+            self._failures.pop(account, None)
+
+
+login_throttle = LoginThrottle(LOGIN_MAX_FAILED_ATTEMPTS, LOGIN_ATTEMPT_WINDOW_SECONDS)
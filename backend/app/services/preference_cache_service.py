@@ -0,0 +1,103 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from threading import Lock
+from typing import Dict, Iterable, Optional
+import logging
+import os
+import time
+
+from app.database import SessionLocal
+from app.models.notification import NotificationPreference
+from app.rows import read_rows
+from app.schemas.notification import NotificationPreferenceBase
+from app.services.table_version_service import bump_table_version, get_table_versions
+
+logger = logging.getLogger(__name__)
+
+# How often each worker checks whether another worker changed preferences
+PREFERENCE_REFRESH_SECONDS = float(os.getenv("NOTIFICATION_PREFERENCE_REFRESH_SECONDS", "10"))
+
+PREFERENCE_FIELDS = tuple(NotificationPreferenceBase.model_fields)
+PREFERENCE_COLUMNS = [NotificationPreference.user_id] + [getattr(NotificationPreference, name) for name in PREFERENCE_FIELDS]
+
+# What a user without a notification_preferences row gets
+DEFAULT_PREFERENCES = NotificationPreferenceBase()
+
+_preferences: Dict[int, NotificationPreferenceBase] = {}
+_version: Optional[int] = None
+_checked_at = 0.0
+_lock = Lock()
+
+def _snapshot(row) -> NotificationPreferenceBase:
+    # NULL columns (rows written before a field existed) fall back to the defaults
+    values = {}
+    for name in PREFERENCE_FIELDS:
+        value = getattr(row, name)
+        if value is not None:
+            values[name] = value
+    return NotificationPreferenceBase(**values)
+
+def load_preferences():
+    """Load every user's notification preferences in one query (called at startup)"""
+    global _preferences, _version, _checked_at
+    db = SessionLocal()
+    try:
+        version, = get_table_versions(db, "notification_preferences")
+        rows = read_rows(db, select(*PREFERENCE_COLUMNS))
+        _preferences = {row.user_id: _snapshot(row) for row in rows}
+        _version = version
+        logger.info(f"Loaded notification preferences for {len(rows)} users")
+    except Exception as e:
+        logger.error(f"Failed to load notification preferences: {e}")
+    finally:
+        _checked_at = time.monotonic()
+        db.close()
+
+def _refresh_if_changed():
+    global _checked_at
+    db = SessionLocal()
+    try:
+        version, = get_table_versions(db, "notification_preferences")
+    except Exception as e:
+        logger.error(f"Failed to check notification preference version: {e}")
+        version = _version
+    finally:
+        db.close()
+    if version != _version:
+        load_preferences()
+    else:
+        _checked_at = time.monotonic()
+
+def _ensure_fresh():
+    if _version is None or time.monotonic() - _checked_at > PREFERENCE_REFRESH_SECONDS:
+        with _lock:
+            if _version is None or time.monotonic() - _checked_at > PREFERENCE_REFRESH_SECONDS:
+                _refresh_if_changed()
+
+def get_cached_preferences(user_id: int) -> NotificationPreferenceBase:
+    """A user's preferences from the in-process cache; never touches the table for a miss"""
+    _ensure_fresh()
+    return _preferences.get(user_id, DEFAULT_PREFERENCES)
+
+def get_cached_preferences_for(user_ids: Iterable[int]) -> Dict[int, NotificationPreferenceBase]:
+    _ensure_fresh()
+    return {user_id: _preferences.get(user_id, DEFAULT_PREFERENCES) for user_id in user_ids}
+
+def store_preferences(db: Session, user_id: int, values: dict) -> NotificationPreference:
+    """Write a user's preferences and update this worker's cache (write-through)
+
+    The table version bump tells the other workers to reload on their next check.
+    """
+    prefs = db.query(NotificationPreference).filter(NotificationPreference.user_id == user_id).first()
+    if prefs is None:
+        prefs = NotificationPreference(user_id=user_id)
+        db.add(prefs)
+    for field, value in values.items():
+        setattr(prefs, field, value)
+    bump_table_version(db, "notification_preferences")
+    db.commit()
+    db.refresh(prefs)
+
+    with _lock:
+        _preferences[user_id] = _snapshot(prefs)
+    return prefs
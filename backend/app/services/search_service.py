@@ -0,0 +1,40 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, union_all, func, literal, or_
+from sqlalchemy.dialects.mysql import match
+
+from app.models.item_comment import ItemComment
+from app.models.work_item import WorkItem
+
+# Title/description hits rank above hits that only appear in comments
+ITEM_WEIGHT = 2.0
+COMMENT_WEIGHT = 1.0
+
+def search_scores(db: Session, q: str):
+    """Subquery of (item_id, score) for tickets matching q in their text or comments
+    
+    MySQL uses the FULLTEXT indexes from add_search_indexes.sql with natural
+    language relevance. Other databases (SQLite in development) fall back to
+    LIKE matching with a fixed score per hit.
+    """
+    if db.get_bind().dialect.name == "mysql":
+        item_relevance = match(WorkItem.title, WorkItem.description, against=q).in_natural_language_mode()
+        comment_relevance = match(ItemComment.body, against=q).in_natural_language_mode()
+        item_hits = select(
+            WorkItem.id.label("item_id"), (item_relevance * ITEM_WEIGHT).label("score")
+        ).where(item_relevance > 0)
+        comment_hits = select(
+            ItemComment.item_id.label("item_id"), (comment_relevance * COMMENT_WEIGHT).label("score")
+        ).where(comment_relevance > 0)
+    else:
+        pattern = f"%{q}%"
+        item_hits = select(
+            WorkItem.id.label("item_id"), literal(ITEM_WEIGHT).label("score")
+        ).where(or_(WorkItem.title.ilike(pattern), WorkItem.description.ilike(pattern)))
+        comment_hits = select(
+            ItemComment.item_id.label("item_id"), literal(COMMENT_WEIGHT).label("score")
+        ).where(ItemComment.body.ilike(pattern))
+    
+    hits = union_all(item_hits, comment_hits).subquery()
+    return select(
+        hits.c.item_id, func.sum(hits.c.score).label("score")
+    ).group_by(hits.c.item_id).subquery()
@@ -0,0 +1,30 @@
+from sqlalchemy.orm import Session
+from typing import Tuple
+
+from app.models.table_version import TableVersion
+
+def bump_table_version(db: Session, *table_names: str):
+    """Record a write to the given tables; committed with the caller's transaction"""
+    for table_name in table_names:
+        next_table_version(db, table_name)
+
+def next_table_version(db: Session, table_name: str) -> int:
+    """Bump one table's version and return the new value
+    
+    The UPDATE holds the version row's lock until the caller commits, so
+    writers of the same table commit in version order.
+    """
+    updated = db.query(TableVersion).filter(
+        TableVersion.table_name == table_name
+    ).update({"version": TableVersion.version + 1}, synchronize_session=False)
+    if not updated:
+        db.add(TableVersion(table_name=table_name, version=1))
+    db.flush()
+    return db.query(TableVersion.version).filter(TableVersion.table_name == table_name).scalar()
+
+def get_table_versions(db: Session, *table_names: str) -> Tuple[int, ...]:
+    """Current versions of the given tables in one query (0 if never written)"""
+    rows = dict(db.query(TableVersion.table_name, TableVersion.version).filter(
+        TableVersion.table_name.in_(table_names)
+    ).all())
+    return tuple(rows.get(table_name, 0) for table_name in table_names)
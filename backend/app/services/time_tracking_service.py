@@ -0,0 +1,40 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case
+from decimal import Decimal
+
+from app.models.time_entry import TimeEntry
+from app.models.work_item import WorkItem
+from app.schemas.time_entry import TimeStats
+
+def calculate_ticket_time_stats(db: Session, work_item: WorkItem) -> TimeStats:
+    """Aggregate logged time for a ticket against its estimate"""
+    result = db.query(
+        func.sum(TimeEntry.hours).label('total_hours'),
+        func.sum(case((TimeEntry.is_billable == True, TimeEntry.hours), else_=0)).label('billable_hours'),
+        func.sum(case((TimeEntry.is_billable == False, TimeEntry.hours), else_=0)).label('non_billable_hours'),
+        func.count(TimeEntry.id).label('entry_count')
+    ).filter(TimeEntry.work_item_id == work_item.id).first()
+    
+    total_hours = result.total_hours or Decimal('0')
+    billable_hours = result.billable_hours or Decimal('0')
+    non_billable_hours = result.non_billable_hours or Decimal('0')
+    entry_count = result.entry_count or 0
+    
+    # Calculate remaining and percent
+    estimated_hours = work_item.estimated_hours
+    remaining_hours = None
+    percent_complete = None
+    
+    if estimated_hours and estimated_hours > 0:
+        remaining_hours = max(Decimal('0'), estimated_hours - total_hours)
+        percent_complete = min(100.0, float((total_hours / estimated_hours) * 100))
+    
+    return TimeStats(
+        total_hours=total_hours,
+        billable_hours=billable_hours,
+        non_billable_hours=non_billable_hours,
+        entry_count=entry_count,
+        estimated_hours=estimated_hours,
+        remaining_hours=remaining_hours,
+        percent_complete=percent_complete
+    )
@@ -0,0 +1,109 @@
+from sqlalchemy.orm import Session
+from threading import Lock, Thread
+from typing import Dict
+import logging
+import os
+import time
+
+from app.database import SessionLocal
+from app.models.token_version import UserTokenVersion
+
+logger = logging.getLogger(__name__)
+
+# How often each worker reloads versions bumped by other workers
+TOKEN_VERSION_REFRESH_SECONDS = float(os.getenv("TOKEN_VERSION_REFRESH_SECONDS", "10"))
+
+_versions: Dict[int, int] = {}
+_loaded_at = 0.0
+_refreshing = False
+_lock = Lock()
+
+def _refresh_versions():
+    global _versions, _loaded_at
+    db = SessionLocal()
+    try:
+        rows = db.query(UserTokenVersion.user_id, UserTokenVersion.version).all()
+        _versions = {user_id: version for user_id, version in rows}
+        _loaded_at = time.monotonic()
+    except Exception as e:
+        logger.error(f"Failed to load token versions: {e}")
+    finally:
+        db.close()
+
+def load_token_versions():
+    """Load every user's token version (called at startup)"""
+    with _lock:
+        _refresh_versions()
+
+def _refresh_in_background():
+    global _refreshing
+    try:
+        _refresh_versions()
+    finally:
+        _refreshing = False
+
+def get_token_version(user_id: int) -> int:
+    """Get the current token version for a user from the in-memory table
+    
+    Never blocks once loaded: a stale table keeps being served while a
+    background thread reloads it, because in async mode this runs on the
+    event loop thread.
+    """
+    global _refreshing
+    if not _loaded_at:
+        # Not loaded at startup (scripts, tests): load in the caller
+        with _lock:
+            if not _loaded_at:
+                _refresh_versions()
+    elif time.monotonic() - _loaded_at > TOKEN_VERSION_REFRESH_SECONDS and not _refreshing:
+        with _lock:
+            if not _refreshing:
+                _refreshing = True
+                Thread(target=_refresh_in_background, name="token-version-refresh", daemon=True).start()
+    return _versions.get(user_id, 0)
+
+def read_token_version(db: Session, user_id: int) -> int:
+    """A user's token version read from the table in the caller's transaction
+    
+    Used when issuing a token, so it never carries a version this worker's
+    in-memory table has not caught up with yet.
+    """
+    version = db.query(UserTokenVersion.version).filter(
+        UserTokenVersion.user_id == user_id
+    ).scalar() or 0
+    _remember(user_id, version)
+    return version
+
+def is_token_version_current(user_id: int, version: int) -> bool:
+    """Whether a token's version is still valid for the user
+    
+    Versions only go up and only signed tokens get here, so a token newer
+    than the in-memory table means the table is behind (the version was
+    bumped or the token issued on another worker): accept it and remember
+    the newer version, which also rejects older tokens right away.
+    """
+    known = get_token_version(user_id)
+    if version > known:
+        _remember(user_id, version)
+        return True
+    return version == known
+
+def _remember(user_id: int, version: int):
+    if version > _versions.get(user_id, 0):
+        _versions[user_id] = version
+
+def bump_token_version(db: Session, user_id: int) -> int:
+    """Revoke all tokens issued to a user; committed with the caller's transaction"""
+    row = db.query(UserTokenVersion).filter(
+        UserTokenVersion.user_id == user_id
+    ).with_for_update().first()
+    
+    if row:
+        row.version += 1
+    else:
+        row = UserTokenVersion(user_id=user_id, version=_versions.get(user_id, 0) + 1)
+        db.add(row)
+    db.flush()
+    
+    _versions[user_id] = row.version
+    return row.version
@@ -0,0 +1,126 @@
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from typing import Dict
+import logging
+import os
+
+from app.cache import TTLCache
+from app.models.notification import Notification
+from app.models.notification_unread_count import NotificationUnreadCount
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Counts served from memory may lag writes made by other workers by this much
+UNREAD_COUNT_CACHE_TTL_SECONDS = float(os.getenv("UNREAD_COUNT_CACHE_TTL_SECONDS", "5"))
+UNREAD_COUNT_CACHE_MAX_ENTRIES = int(os.getenv("UNREAD_COUNT_CACHE_MAX_ENTRIES", "8192"))
+RECONCILE_BATCH_SIZE = 500
+
+unread_count_cache = TTLCache(maxsize=UNREAD_COUNT_CACHE_MAX_ENTRIES, ttl=UNREAD_COUNT_CACHE_TTL_SECONDS)
+
+def increment_unread_counts(db: Session, counts: Dict[int, int]):
+    """Add new unread notifications to users' counters in one upsert (caller's transaction)"""
+    if not counts:
+        return
+    _upsert_counts(db, counts, add=True)
+    for user_id in counts:
+        unread_count_cache.invalidate(user_id)
+
+def _upsert_counts(db: Session, counts: Dict[int, int], add: bool):
+    # Inserts missing counter rows; existing rows get the count added, or
+    # are left alone when add is False
+    table = NotificationUnreadCount.__table__
+    values = [{"user_id": user_id, "unread_count": count} for user_id, count in counts.items()]
+    # MySQL in production, SQLite in development
+    if db.get_bind().dialect.name == "mysql":
+        statement = mysql_insert(table).values(values)
+        if add:
+            statement = statement.on_duplicate_key_update(
+                unread_count=table.c.unread_count + statement.inserted.unread_count,
+                updated_at=func.now()
+            )
+        else:
+            statement = statement.on_duplicate_key_update(unread_count=table.c.unread_count)
+    else:
+        statement = sqlite_insert(table).values(values)
+        if add:
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.user_id],
+                set_={"unread_count": table.c.unread_count + statement.excluded.unread_count, "updated_at": func.now()}
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=[table.c.user_id])
+    db.execute(statement)
+
+def decrement_unread_count(db: Session, user_id: int, count: int = 1):
+    """Take notifications that were read or deleted off a user's counter (never below 0)"""
+    if count <= 0:
+        return
+    column = NotificationUnreadCount.unread_count
+    db.query(NotificationUnreadCount).filter(NotificationUnreadCount.user_id == user_id).update(
+        {"unread_count": case((column > count, column - count), else_=0)},
+        synchronize_session=False
+    )
+    unread_count_cache.invalidate(user_id)
+
+def get_unread_count(db: Session, user_id: int) -> int:
+    """A user's unread notification count: memory, else one primary key lookup"""
+    count = unread_count_cache.get(user_id)
+    if count is None:
+        count = db.query(NotificationUnreadCount.unread_count).filter(
+            NotificationUnreadCount.user_id == user_id
+        ).scalar() or 0
+        unread_count_cache.set(user_id, count)
+    return count
+
+def reconcile_unread_counts(db: Session, batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+    """Recount unread notifications per user and fix counters that drifted
+
+    Works one user id range per transaction. The range's counter rows are
+    locked by the transaction's first statement, so the snapshot the COUNT
+    reads is taken only once they are held: writers that committed earlier
+    are counted, and writers still in flight wait for the lock and apply
+    their delta on top of the corrected value. Returns the number of users
+    corrected.
+    """
+    max_user_id = db.query(func.max(User.id)).scalar() or 0
+    db.commit()
+
+    fixed = 0
+    upper_id = 0
+    while upper_id < max_user_id:
+        lower_id, upper_id = upper_id, upper_id + batch_size
+
+        # Locking read first; on MySQL it also gap-locks the range, so no
+        # counter row can be inserted into it until this batch commits
+        stored = dict(db.query(NotificationUnreadCount.user_id, NotificationUnreadCount.unread_count).filter(
+            NotificationUnreadCount.user_id > lower_id,
+            NotificationUnreadCount.user_id <= upper_id
+        ).with_for_update().all())
+        actual = dict(db.execute(select(Notification.user_id, func.count(Notification.id)).where(
+            Notification.user_id > lower_id,
+            Notification.user_id <= upper_id,
+            Notification.is_read == False
+        ).group_by(Notification.user_id)).all())
+
+        for user_id, count in stored.items():
+            expected = actual.get(user_id, 0)
+            if count != expected:
+                db.query(NotificationUnreadCount).filter(NotificationUnreadCount.user_id == user_id).update(
+                    {"unread_count": expected}, synchronize_session=False
+                )
+                fixed += 1
+        missing = {user_id: count for user_id, count in actual.items() if user_id not in stored}
+        if missing:
+            # Never fails on a row a concurrent fan-out created meanwhile;
+            # such a row is left for the next run
+            _upsert_counts(db, missing, add=False)
+            fixed += len(missing)
+        db.commit()
+        for user_id in set(stored) | set(missing):
+            unread_count_cache.invalidate(user_id)
+
+    logger.info(f"Reconciled unread notification counters for {fixed} users")
+    return fixed
@@ -0,0 +1,28 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator
+import json
+
+STREAM_BATCH_SIZE = 500
+
+def json_default(value: Any):
+    """Encode the column types our models return"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def ndjson_chunks(rows: Iterable[dict], batch_size: int = STREAM_BATCH_SIZE) -> Iterator[bytes]:
+    """Serialize rows one per line, flushing a chunk every batch_size rows"""
+    buffer = []
+    for row in rows:
+        buffer.append(json.dumps(row, default=json_default, separators=(",", ":")))
+        if len(buffer) >= batch_size:
+            yield ("\n".join(buffer) + "\n").encode()
+            buffer = []
+    if buffer:
+        yield ("\n".join(buffer) + "\n").encode()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Sync vs async database benchmark for the hot read endpoints
+Starts the API once with USE_ASYNC_DB=false and once with USE_ASYNC_DB=true,
+drives GET /items, /notifications, /notifications/unread-count and /auth/me
+with many concurrent keep-alive clients, and reports throughput and latency.
+
+Usage: python benchmark_async_db.py [--concurrency N] [--seconds S] [--threadpool N]
+Uses DATABASE_URL from the environment / .env like the app itself.
+"""
+
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import requests
+from pathlib import Path
+
+backend_dir = Path(__file__).parent
+
+PORT = 8031
+BASE_URL = f"http://127.0.0.1:{PORT}"
+EMAIL = "pm@example.com"
+PASSWORD = "password123"
+ENDPOINTS = ["/items?limit=50", "/notifications", "/notifications/unread-count", "/auth/me"]
+
+def arg(name, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+CONCURRENCY = arg("--concurrency", 200)
+SECONDS = arg("--seconds", 20)
+THREADPOOL = arg("--threadpool", 40)
+
+def start_server(use_async):
+    env = dict(os.environ, USE_ASYNC_DB="true" if use_async else "false", THREADPOOL_SIZE=str(THREADPOOL))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(PORT), "--log-level", "warning"],
+        cwd=backend_dir, env=env
+    )
+    for _ in range(100):
+        try:
+            requests.get(BASE_URL, timeout=1)
+            return server
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("Server did not start")
+
+async def client(path_cycle, headers, deadline, latencies):
+    """One keep-alive connection issuing GETs back to back until the deadline"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", PORT)
+    request_headers = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    index = 0
+    try:
+        while time.perf_counter() < deadline:
+            path = path_cycle[index % len(path_cycle)]
+            index += 1
+            start = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n{request_headers}\r\n".encode())
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = next(
+                int(line.split(b":", 1)[1])
+                for line in head.split(b"\r\n") if line.lower().startswith(b"content-length:")
+            )
+            await reader.readexactly(length)
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        writer.close()
+
+async def load(headers):
+    latencies = []
+    deadline = time.perf_counter() + SECONDS
+    # Stagger the endpoint order so every endpoint is in flight at once
+    cycles = [ENDPOINTS[i % len(ENDPOINTS):] + ENDPOINTS[:i % len(ENDPOINTS)] for i in range(CONCURRENCY)]
+    await asyncio.gather(*(client(cycle, headers, deadline, latencies) for cycle in cycles))
+    return latencies
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def main():
+    print(f"🏁 {CONCURRENCY} clients for {SECONDS}s each, threadpool of {THREADPOOL}")
+    results = {}
+    for mode in ("sync", "async"):
+        server = start_server(mode == "async")
+        try:
+            token = requests.post(f"{BASE_URL}/auth/login", data={"username": EMAIL, "password": PASSWORD}).json()["access_token"]
+            latencies = asyncio.run(load({"Authorization": f"Bearer {token}"}))
+        finally:
+            server.terminate()
+            server.wait()
+        results[mode] = latencies
+
+    print(f"\n📊 {'mode':>6} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for mode, latencies in results.items():
+        print(f"   {mode:>6} {len(latencies) / SECONDS:>9.0f} {statistics.median(latencies):>8.1f} {percentile(latencies, 99):>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+ORM hydration vs Core rows benchmark for the read-only report and list paths
+For each case, loads the same rows both ways and reports the best wall time
+and the peak memory allocated (tracemalloc) while the result is built:
+  orm   db.query(WorkItem).all(): ORM instances tracked in the identity map
+  core  app.rows.read_rows / read_columns: plain Row tuples, no session state
+
+Usage: python benchmark_core_rows.py [--rows N] [--seed]
+  --seed  insert synthetic done support items until the table holds N rows
+Uses DATABASE_URL from the environment / .env like the app itself.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import select
+
+import app.models  # noqa: F401 (registers every mapper)
+from app.database import SessionLocal
+from app.models.user import User
+from app.models.work_item import WorkItem
+from app.rows import read_columns, read_rows, schema_columns
+from app.schemas.work_item import WorkItem as WorkItemSchema
+from app.serialization import serialize_rows
+
+EMAIL = "pm@example.com"
+ROWS = int(sys.argv[sys.argv.index("--rows") + 1]) if "--rows" in sys.argv else 100000
+REPEAT = 3
+
+def seed_items(db, target):
+    existing = db.query(WorkItem).count()
+    reporter = db.query(User).filter(User.email == EMAIL).first()
+    print(f"🌱 Seeding {max(0, target - existing)} items...")
+    now = datetime.now(timezone.utc)
+    batch = []
+    for i in range(existing, target):
+        batch.append({
+            "title": f"Benchmark item {i}",
+            "description": "Synthetic ticket used by benchmark_core_rows.py " * 4,
+            "type": "support",
+            "status": "done",
+            "priority": "normal",
+            "reporter_id": reporter.id,
+            "created_at": now - timedelta(hours=i % 72),
+            "updated_at": now,
+        })
+        if len(batch) == 5000:
+            db.bulk_insert_mappings(WorkItem, batch)
+            db.commit()
+            batch = []
+    if batch:
+        db.bulk_insert_mappings(WorkItem, batch)
+        db.commit()
+
+def mttr_from(items):
+    return sum((item.updated_at - item.created_at).total_seconds() for item in items) / 3600 / max(len(items), 1)
+
+def cases(db):
+    """(name, ORM version, Core version) pairs mirroring the ported endpoints"""
+    done = (WorkItem.status == "done", WorkItem.type == "support")
+    columns = schema_columns(WorkItem, WorkItemSchema)
+    return [
+        (
+            "item list",
+            lambda: serialize_rows(WorkItemSchema, db.query(WorkItem).limit(ROWS).all()),
+            lambda: serialize_rows(WorkItemSchema, read_rows(db, select(*columns).limit(ROWS))),
+        ),
+        (
+            "weekly MTTR",
+            lambda: mttr_from(db.query(WorkItem).filter(*done).limit(ROWS).all()),
+            lambda: mean_hours(*read_columns(db, select(WorkItem.created_at, WorkItem.updated_at).where(*done).limit(ROWS))),
+        ),
+    ]
+
+def mean_hours(created, updated):
+    return sum((done - opened).total_seconds() for opened, done in zip(created, updated)) / 3600 / max(len(created), 1)
+
+def measure(db, fn):
+    """Best wall time over REPEAT runs, then peak traced allocation of one run"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        db.expunge_all()
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    db.expunge_all()
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    db.expunge_all()
+    return best * 1000, peak / 1024 / 1024
+
+def main():
+    db = SessionLocal()
+    try:
+        if "--seed" in sys.argv:
+            seed_items(db, ROWS)
+        print(f"⏱️  Best of {REPEAT} runs over up to {ROWS} rows\n")
+        print(f"   {'case':<12} {'orm ms':>9} {'core ms':>9} {'orm MiB':>9} {'core MiB':>9}")
+        for name, orm, core in cases(db):
+            orm_ms, orm_mib = measure(db, orm)
+            core_ms, core_mib = measure(db, core)
+            print(f"   {name:<12} {orm_ms:>9.0f} {core_ms:>9.0f} {orm_mib:>9.1f} {core_mib:>9.1f}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
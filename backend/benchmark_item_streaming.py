@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Item listing benchmark: buffered GET /items vs NDJSON GET /items/stream
+Reports time-to-first-byte, total time and the server's peak RSS growth.
+
+Usage: python benchmark_item_streaming.py <server_pid> [base_url] [--seed]
+  --seed  insert synthetic items until the table holds 100k rows
+"""
+
+import sys
+import time
+import threading
+import requests
+from pathlib import Path
+
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+BASE_URL = next((arg for arg in sys.argv[2:] if arg.startswith("http")), "http://localhost:8030")
+EMAIL = "pm@example.com"
+PASSWORD = "password123"
+SIZES = [10000, 100000]
+PAGE_LIMIT = 10000  # read_items caps limit at 10000
+
+def seed_items(target):
+    from app.database import SessionLocal
+    from app.models.user import User
+    from app.models.work_item import WorkItem
+
+    db = SessionLocal()
+    try:
+        existing = db.query(WorkItem).count()
+        reporter = db.query(User).filter(User.email == EMAIL).first()
+        print(f"🌱 Seeding {max(0, target - existing)} items...")
+        batch = []
+        for i in range(existing, target):
+            batch.append({
+                "title": f"Benchmark item {i}",
+                "description": "Synthetic ticket used by benchmark_item_streaming.py " * 8,
+                "type": "support",
+                "status": "backlog",
+                "priority": "normal",
+                "reporter_id": reporter.id,
+            })
+            if len(batch) == 5000:
+                db.bulk_insert_mappings(WorkItem, batch)
+                db.commit()
+                batch = []
+        if batch:
+            db.bulk_insert_mappings(WorkItem, batch)
+            db.commit()
+    finally:
+        db.close()
+
+def read_rss_kb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+class RssSampler:
+    """Track the server's peak RSS while a request runs"""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.peak = 0
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        self.start = read_rss_kb(self.pid)
+        self.peak = self.start
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, read_rss_kb(self.pid))
+            time.sleep(0.005)
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+def timed_get(url, headers):
+    start = time.perf_counter()
+    with requests.get(url, headers=headers, stream=True) as response:
+        response.raise_for_status()
+        chunks = response.iter_content(chunk_size=65536)
+        first = next(chunks, b"")
+        ttfb = time.perf_counter() - start
+        size = len(first) + sum(len(chunk) for chunk in chunks)
+    return ttfb, time.perf_counter() - start, size
+
+def bench_buffered(size, headers):
+    ttfb = None
+    total = 0.0
+    for skip in range(0, size, PAGE_LIMIT):
+        page_ttfb, elapsed, _ = timed_get(f"{BASE_URL}/items?skip={skip}&limit={PAGE_LIMIT}", headers)
+        ttfb = page_ttfb if ttfb is None else ttfb
+        total += elapsed
+    return ttfb, total
+
+def bench_stream(size, headers):
+    ttfb, total, _ = timed_get(f"{BASE_URL}/items/stream?limit={size}", headers)
+    return ttfb, total
+
+def main():
+    if len(sys.argv) < 2 or not sys.argv[1].isdigit():
+        print(__doc__)
+        sys.exit(1)
+    pid = int(sys.argv[1])
+
+    if "--seed" in sys.argv:
+        seed_items(max(SIZES))
+
+    token = requests.post(f"{BASE_URL}/auth/login", data={"username": EMAIL, "password": PASSWORD}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print(f"\n📊 {'items':>7} {'mode':>9} {'TTFB ms':>9} {'total ms':>9} {'peak RSS +MB':>13}")
+    for size in SIZES:
+        for mode, bench in (("buffered", bench_buffered), ("stream", bench_stream)):
+            with RssSampler(pid) as rss:
+                ttfb, total = bench(size, headers)
+            growth = (rss.peak - rss.start) / 1024
+            print(f"   {size:>7} {mode:>9} {ttfb * 1000:>9.1f} {total * 1000:>9.1f} {growth:>13.1f}")
+    print("\nℹ️  Buffered mode pages through read_items 10k rows at a time.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Login storm benchmark
+Measures latency of an unrelated endpoint while many users log in at once.
+Run against a live server: python benchmark_login_storm.py [base_url]
+"""
+
+import sys
+import time
+import threading
+import statistics
+import requests
+
+BASE_URL = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8030"
+EMAIL = "pm@example.com"
+PASSWORD = "password123"
+LOGIN_THREADS = 32
+PROBE_REQUESTS = 200
+
+def login():
+    response = requests.post(f"{BASE_URL}/auth/login", data={"username": EMAIL, "password": PASSWORD})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+def probe(headers, count):
+    """Time GET /notifications/unread-count, which never touches bcrypt"""
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        requests.get(f"{BASE_URL}/notifications/unread-count", headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def report(label, latencies):
+    print(f"{label:>14}: p50={statistics.median(latencies):7.1f} ms  "
+          f"p99={percentile(latencies, 99):7.1f} ms  max={max(latencies):7.1f} ms")
+
+def main():
+    print(f"🔐 Login storm benchmark against {BASE_URL}")
+    headers = {"Authorization": f"Bearer {login()}"}
+
+    baseline = probe(headers, PROBE_REQUESTS)
+
+    stop = threading.Event()
+    logins = []
+
+    def storm():
+        while not stop.is_set():
+            start = time.perf_counter()
+            requests.post(f"{BASE_URL}/auth/login", data={"username": EMAIL, "password": PASSWORD})
+            logins.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=storm, daemon=True) for _ in range(LOGIN_THREADS)]
+    storm_start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    under_storm = probe(headers, PROBE_REQUESTS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    storm_seconds = time.perf_counter() - storm_start
+
+    print(f"\n📊 unread-count latency ({PROBE_REQUESTS} requests each)")
+    report("idle", baseline)
+    report("login storm", under_storm)
+    print(f"\n🚀 {len(logins)} logins in {storm_seconds:.1f}s "
+          f"({len(logins) / storm_seconds:.1f}/s with {LOGIN_THREADS} clients)")
+
+if __name__ == "__main__":
+    main()
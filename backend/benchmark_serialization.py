@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Serialization microbenchmark
+Per-item cost of turning ORM rows into a response body for WorkItem,
+TimeEntry and Notification lists:
+  response_model  Pydantic from_attributes validation + jsonable_encoder + json
+                  (what FastAPI does for a returned list of ORM objects)
+  orjson          row_serializer + ORJSONResponse
+  msgpack         row_serializer + MsgpackResponse
+
+Usage: python benchmark_serialization.py [rows]
+Runs without a database; rows are transient ORM objects.
+"""
+
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+import app.models  # noqa: F401 (registers every mapper)
+from app.models.work_item import WorkItem
+from app.models.time_entry import TimeEntry
+from app.models.notification import Notification
+from app.schemas.work_item import WorkItem as WorkItemSchema
+from app.schemas.time_entry import TimeEntry as TimeEntrySchema
+from app.schemas.notification import Notification as NotificationSchema
+from app.serialization import MsgpackResponse, ORJSONResponse, serialize_rows
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+REPEAT = 5
+
+def make_rows(count):
+    now = datetime.now(timezone.utc)
+    items = [WorkItem(
+        id=i, title=f"Ticket {i}", description="Printer on floor 3 is offline " * 4, type="support",
+        status="in_progress", priority="normal", reporter_id=1, assignee_id=2, branch_id=1,
+        due_at=now, sla_hours=24, estimated_hours=Decimal("3.50"), created_at=now, updated_at=now,
+        comment_count=3, attachment_count=1, total_logged_hours=Decimal("2.25"), last_activity_at=now
+    ) for i in range(count)]
+    entries = [TimeEntry(
+        id=i, work_item_id=i, user_id=2, hours=Decimal("1.50"), description="Investigated",
+        is_billable=True, activity_type="coding", logged_at=now, is_running=False,
+        created_at=now, updated_at=now
+    ) for i in range(count)]
+    notifications = [Notification(
+        id=i, user_id=1, type="ticket_updated", title="Ticket Updated",
+        message=f"Ticket #{i} has been updated", ticket_id=i, related_user_id=2,
+        is_read=False, created_at=now
+    ) for i in range(count)]
+    return [("WorkItem", WorkItemSchema, items), ("TimeEntry", TimeEntrySchema, entries), ("Notification", NotificationSchema, notifications)]
+
+def per_item_us(fn, count):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1_000_000
+
+def main():
+    print(f"⏱️  Best of {REPEAT} runs over {ROWS} rows, µs per item\n")
+    print(f"   {'model':<14} {'response_model':>15} {'orjson':>9} {'msgpack':>9} {'speedup':>8}")
+    for name, schema, rows in make_rows(ROWS):
+        adapter = TypeAdapter(List[schema])
+        baseline = per_item_us(lambda: json.dumps(jsonable_encoder(adapter.validate_python(rows))).encode(), ROWS)
+        fast = per_item_us(lambda: ORJSONResponse(serialize_rows(schema, rows)).body, ROWS)
+        packed = per_item_us(lambda: MsgpackResponse(serialize_rows(schema, rows)).body, ROWS)
+        print(f"   {name:<14} {baseline:>15.2f} {fast:>9.2f} {packed:>9.2f} {baseline / fast:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Idle SSE connection benchmark
+Opens many GET /events/stream connections and measures the server's CPU
+time and RSS while they sit idle, then checks that an item update still
+reaches every connection.
+
+Usage: python benchmark_sse_connections.py <server_pid> [base_url] [--connections N]
+Raise the open file limit first (ulimit -n) on both client and server.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import requests
+from urllib.parse import urlparse
+
+BASE_URL = next((arg for arg in sys.argv[2:] if arg.startswith("http")), "http://localhost:8030")
+EMAIL = "pm@example.com"
+PASSWORD = "password123"
+CONNECTIONS = int(sys.argv[sys.argv.index("--connections") + 1]) if "--connections" in sys.argv else 2000
+IDLE_SECONDS = 30
+
+def read_cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    # utime and stime, in clock ticks
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+def read_rss_kb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+async def open_stream(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n".encode())
+    await writer.drain()
+    await reader.readuntil(b"\r\n\r\n")
+    return reader, writer
+
+async def wait_for_event(reader, name):
+    while True:
+        line = await reader.readline()
+        if not line:
+            return False
+        if line.startswith(f"event: {name}".encode()):
+            return True
+
+async def run(pid, token, headers):
+    url = urlparse(BASE_URL)
+    path = f"/events/stream?token={token}"
+    
+    print(f"🔌 Opening {CONNECTIONS} event streams...")
+    start = time.perf_counter()
+    streams = []
+    for offset in range(0, CONNECTIONS, 200):
+        batch = [open_stream(url.hostname, url.port or 80, path) for _ in range(min(200, CONNECTIONS - offset))]
+        streams += await asyncio.gather(*batch)
+    print(f"   connected in {time.perf_counter() - start:.1f}s, server RSS {read_rss_kb(pid) / 1024:.1f} MB")
+    
+    cpu_before = read_cpu_seconds(pid)
+    await asyncio.sleep(IDLE_SECONDS)
+    cpu_idle = read_cpu_seconds(pid) - cpu_before
+    print(f"\n📊 {CONNECTIONS} idle connections for {IDLE_SECONDS}s: "
+          f"{cpu_idle:.2f}s server CPU ({cpu_idle / IDLE_SECONDS * 100:.1f}% of one core)")
+    
+    item_id = requests.get(f"{BASE_URL}/items?limit=1", headers=headers).json()[0]["id"]
+    start = time.perf_counter()
+    await asyncio.to_thread(requests.patch, f"{BASE_URL}/items/{item_id}", json={"priority": "normal"}, headers=headers)
+    delivered = await asyncio.gather(*(
+        asyncio.wait_for(wait_for_event(reader, "item.updated"), timeout=30) for reader, _ in streams
+    ), return_exceptions=True)
+    received = sum(1 for result in delivered if result is True)
+    print(f"📣 item.updated reached {received}/{CONNECTIONS} streams in {time.perf_counter() - start:.2f}s")
+    
+    for _, writer in streams:
+        writer.close()
+
+def main():
+    if len(sys.argv) < 2 or not sys.argv[1].isdigit():
+        print(__doc__)
+        sys.exit(1)
+    pid = int(sys.argv[1])
+    
+    token = requests.post(f"{BASE_URL}/auth/login", data={"username": EMAIL, "password": PASSWORD}).json()["access_token"]
+    asyncio.run(run(pid, token, {"Authorization": f"Bearer {token}"}))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Query plan regression check for the hot work_items queries
+Runs EXPLAIN on each query used by the item list, reports and scheduler
+and exits non-zero if any of them falls back to a full table scan or has
+to sort its rows (SQLite TEMP B-TREE, MySQL filesort) instead of reading
+them in index order.
+
+Usage: python check_query_plans.py [--seed N]
+  --seed N  insert synthetic items until work_items holds N rows, so the
+            optimizer sees a realistic table instead of a handful of rows
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal, engine
+from app.auth import CachedUser
+from app.pagination import encode_cursor
+from app.models.user import User
+from app.models.work_item import WorkItem
+from app.routers.items import scoped_items_query, apply_keyset_page
+
+OPEN_STATUSES = ["backlog", "in_progress", "review"]
+
+def hot_queries(db):
+    """(name, Query) pairs mirroring the filters of the hot endpoints and jobs"""
+    now = datetime.now(timezone.utc)
+    week_start = now - timedelta(days=now.weekday())
+    requester = CachedUser(id=3, name="requester", email="", role="requester", branch_id=1, is_active=True)
+    dev = CachedUser(id=2, name="dev", email="", role="dev", branch_id=1, is_active=True)
+    pm = CachedUser(id=1, name="pm", email="", role="pm", branch_id=None, is_active=True)
+
+    return [
+        ("read_items requester branch scope",
+            scoped_items_query(db, requester).order_by(WorkItem.id.desc()).limit(100)),
+        ("read_items branch + status filter",
+            scoped_items_query(db, requester, status="in_progress", type="support")),
+        ("read_items assignee=me",
+            scoped_items_query(db, dev, assignee_id="me", status="in_progress")),
+        ("read_items keyset by id (requester branch)",
+            apply_keyset_page(scoped_items_query(db, requester), "id", encode_cursor(1000000), 100)),
+        ("read_items keyset by id (dev branch)",
+            apply_keyset_page(scoped_items_query(db, dev), "id", encode_cursor(1000000), 100)),
+        ("read_items keyset by id (assignee=me)",
+            apply_keyset_page(scoped_items_query(db, dev, assignee_id="me"), "id", encode_cursor(1000000), 100)),
+        ("read_items keyset by id (pm, branch filter)",
+            apply_keyset_page(scoped_items_query(db, pm, branch_id=1), "id", None, 100)),
+        ("read_items keyset by updated_at",
+            apply_keyset_page(scoped_items_query(db, requester), "updated_at", encode_cursor(now, 1000000), 100)),
+        ("get_weekly_report tickets opened",
+            db.query(WorkItem).filter(
+                WorkItem.type == "support",
+                WorkItem.created_at >= week_start,
+                WorkItem.created_at < week_start + timedelta(days=7))),
+        ("get_weekly_report tickets closed / MTTR",
+            db.query(WorkItem).filter(
+                WorkItem.type == "support",
+                WorkItem.status == "done",
+                WorkItem.updated_at >= week_start,
+                WorkItem.updated_at < week_start + timedelta(days=7))),
+        ("get_sla_alerts / sla_reminders",
+            db.query(WorkItem).filter(
+                WorkItem.status.in_(OPEN_STATUSES),
+                WorkItem.due_at.isnot(None),
+                WorkItem.due_at <= now + timedelta(hours=4))),
+        ("send_standup_digest yesterday",
+            db.query(WorkItem).filter(
+                WorkItem.assignee_id == 2,
+                WorkItem.updated_at >= now - timedelta(days=1),
+                WorkItem.updated_at != WorkItem.created_at)),
+        ("send_standup_digest blockers",
+            db.query(WorkItem).filter(
+                WorkItem.assignee_id == 2,
+                WorkItem.status.in_(OPEN_STATUSES),
+                WorkItem.updated_at <= now - timedelta(days=2))),
+    ]
+
+def explain(conn, query):
+    """Return (plan rows, problems) for a query on the current dialect"""
+    compiled = query.statement.compile(dialect=engine.dialect, compile_kwargs={"render_postcompile": True})
+    problems = []
+    if engine.dialect.name == "sqlite":
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).fetchall()
+        details = [row[-1] for row in rows]
+        if any(detail.startswith("SCAN work_items") and "INDEX" not in detail for detail in details):
+            problems.append("full table scan")
+        if any("TEMP B-TREE" in detail for detail in details):
+            problems.append("sorts rows (TEMP B-TREE)")
+        return details, problems
+
+    rows = conn.exec_driver_sql(f"EXPLAIN {compiled}", compiled.params).mappings().fetchall()
+    details = [f"table={row['table']} type={row['type']} key={row['key']} rows={row['rows']} extra={row['Extra']}" for row in rows]
+    if any(row["table"] == "work_items" and row["type"] == "ALL" for row in rows):
+        problems.append("full table scan")
+    if any("Using filesort" in (row["Extra"] or "") for row in rows):
+        problems.append("sorts rows (filesort)")
+    return details, problems
+
+def seed_items(db, target):
+    existing = db.query(WorkItem).count()
+    reporter = db.query(User).first()
+    if reporter is None or existing >= target:
+        return
+
+    print(f"🌱 Seeding {target - existing} items...")
+    now = datetime.now(timezone.utc)
+    statuses = OPEN_STATUSES + ["done"]
+    batch = []
+    for i in range(existing, target):
+        batch.append({
+            "title": f"Plan check item {i}",
+            "type": "support" if i % 3 else "feature",
+            "status": statuses[i % len(statuses)],
+            "priority": "normal",
+            "branch_id": None,
+            "reporter_id": reporter.id,
+            "assignee_id": reporter.id if i % 7 == 0 else None,
+            "due_at": now + timedelta(hours=i % 500 - 250) if i % 5 == 0 else None,
+        })
+        if len(batch) == 5000:
+            db.bulk_insert_mappings(WorkItem, batch)
+            db.commit()
+            batch = []
+    if batch:
+        db.bulk_insert_mappings(WorkItem, batch)
+        db.commit()
+
+def main():
+    db = SessionLocal()
+    try:
+        if "--seed" in sys.argv:
+            seed_items(db, int(sys.argv[sys.argv.index("--seed") + 1]))
+
+        print(f"🔍 Checking query plans on {engine.dialect.name}...\n")
+        failures = []
+        with engine.connect() as conn:
+            for name, query in hot_queries(db):
+                details, problems = explain(conn, query)
+                print(f"{'❌' if problems else '✅'} {name}")
+                for detail in details:
+                    print(f"     {detail}")
+                if problems:
+                    failures.append((name, problems))
+
+        if failures:
+            print(f"\n❌ {len(failures)} queries are not served by an index:")
+            for name, problems in failures:
+                print(f"   - {name}: {', '.join(problems)}")
+            sys.exit(1)
+        print("\n✅ All hot queries use an index, in index order")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+-- Transactional outbox drained by the notification outbox worker
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    channel VARCHAR(16) NOT NULL,
+    payload JSON NOT NULL,
+    status VARCHAR(16) NOT NULL DEFAULT 'pending',
+    attempts INT NOT NULL DEFAULT 0,
+    next_attempt_at DATETIME NOT NULL,
+    last_error TEXT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_notification_outbox_pending (status, next_attempt_at, id)
+);
@@ -0,0 +1,6 @@
+-- Per-user unread notification counters (see unread_count_service.py)
+CREATE TABLE IF NOT EXISTS notification_unread_counts (
+    user_id INT PRIMARY KEY,
+    unread_count INT NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
@@ -0,0 +1,16 @@
+-- Notification retention (see notification_retention_service.py)
+CREATE INDEX idx_notifications_read_created ON notifications(is_read, created_at, id);
+CREATE TABLE IF NOT EXISTS notifications_archive (
+    id INT PRIMARY KEY,
+    user_id INT NOT NULL,
+    type VARCHAR(32) NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    message TEXT NOT NULL,
+    ticket_id INT NULL,
+    related_user_id INT NULL,
+    is_read BOOLEAN DEFAULT TRUE,
+    read_at TIMESTAMP NULL,
+    created_at TIMESTAMP NULL,
+    archived_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_notifications_archive_user (user_id)
+);
@@ -1,23 +1,42 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import anyio.to_thread
+import os
 import uvicorn
 from dotenv import load_dotenv
 
-from app.database import init_db
-from app.routers import auth, users, items, oncall, reports, branches, activity_reports, notifications, attachments, time_tracking
+from app.database import init_db, async_engine
+from app.routers import auth, users, items, oncall, reports, branches, activity_reports, notifications, attachments, time_tracking, events
+from app.events import event_hub
+from app.notifications.outbox_worker import outbox_worker
 from app.scheduler import start_scheduler
+from app.services.password_service import shutdown_password_pool
+from app.services.preference_cache_service import load_preferences
+from app.services.token_version_service import load_token_versions
 
 load_dotenv()
 
+# Threads available to sync endpoints and dependencies (Starlette's default is 40)
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "40"))
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     init_db()
+    load_preferences()
+    load_token_versions()
     start_scheduler()
+    event_hub.start()
+    outbox_worker.start()
     yield
     # Shutdown
-    pass
+    outbox_worker.stop()
+    event_hub.stop()
+    shutdown_password_pool()
+    if async_engine is not None:
+        await async_engine.dispose()
 
 app = FastAPI(title="IT Support Tool", lifespan=lifespan)
 
@@ -46,6 +65,7 @@ app.include_router(activity_reports.router, prefix="/activity-reports", tags=["a
 app.include_router(notifications.router, prefix="/notifications", tags=["notifications"])
 app.include_router(attachments.router, prefix="/attachments", tags=["attachments"])
 app.include_router(time_tracking.router, prefix="/time-tracking", tags=["time-tracking"])
+app.include_router(events.router, prefix="/events", tags=["events"])
 
 @app.get("/")
 async def root():
@@ -0,0 +1,32 @@
+from app.database import engine
+from sqlalchemy import text
+
+print("🔄 Adding item comment indexes...")
+
+try:
+    with engine.connect() as conn:
+        # Read SQL migration
+        with open('add_comment_indexes.sql', 'r') as f:
+            sql_content = f.read()
+        
+        # Drop comment lines, then split and execute each statement
+        sql_content = "\n".join(line for line in sql_content.splitlines() if not line.strip().startswith('--'))
+        statements = [stmt.strip() + ';' for stmt in sql_content.split(';') if stmt.strip()]
+        
+        for statement in statements:
+            try:
+                conn.execute(text(statement))
+                print(f"✅ Executed: {statement[:80]}...")
+            except Exception as e:
+                if 'Duplicate key name' in str(e):
+                    print(f"ℹ️  Index already exists: {statement[:60]}...")
+                else:
+                    print(f"⚠️  Error: {str(e)[:100]}")
+        
+        conn.commit()
+    
+    print("\n✅ Migration completed successfully!")
+    print("\n🔍 GET /items/{id}/comments pages by (item_id, created_at, id)")
+    
+except Exception as e:
+    print(f"❌ Error: {e}")
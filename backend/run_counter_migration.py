@@ -0,0 +1,41 @@
+from app.database import engine, SessionLocal
+from app.services.item_counter_service import repair_item_counters
+from sqlalchemy import text
+
+print("🔄 Adding work item activity counters...")
+
+try:
+    with engine.connect() as conn:
+        # Read SQL migration
+        with open('add_item_counters.sql', 'r') as f:
+            sql_content = f.read()
+        
+        # Drop comment lines, then split and execute each statement
+        sql_content = "\n".join(line for line in sql_content.splitlines() if not line.strip().startswith('--'))
+        statements = [stmt.strip() + ';' for stmt in sql_content.split(';') if stmt.strip()]
+        
+        for statement in statements:
+            try:
+                conn.execute(text(statement))
+                print(f"✅ Executed: {statement[:80]}...")
+            except Exception as e:
+                if 'Duplicate column name' in str(e) or 'Duplicate key name' in str(e):
+                    print(f"ℹ️  Already applied: {statement[:60]}...")
+                else:
+                    print(f"⚠️  Error: {str(e)[:100]}")
+        
+        conn.commit()
+    
+    # Backfill the counters from comments, attachments and time entries
+    print("\n🧮 Computing counters for existing items...")
+    db = SessionLocal()
+    try:
+        repaired = repair_item_counters(db)
+    finally:
+        db.close()
+    print(f"✅ Backfilled {repaired} items")
+    
+    print("\n✅ Migration completed successfully!")
+    
+except Exception as e:
+    print(f"❌ Error: {e}")
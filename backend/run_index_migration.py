@@ -0,0 +1,32 @@
+from app.database import engine
+from sqlalchemy import text
+
+print("🔄 Adding composite indexes to work_items...")
+
+try:
+    with engine.connect() as conn:
+        # Read SQL migration
+        with open('add_work_item_indexes.sql', 'r') as f:
+            sql_content = f.read()
+        
+        # Drop comment lines, then split and execute each statement
+        sql_content = "\n".join(line for line in sql_content.splitlines() if not line.strip().startswith('--'))
+        statements = [stmt.strip() + ';' for stmt in sql_content.split(';') if stmt.strip()]
+        
+        for statement in statements:
+            try:
+                conn.execute(text(statement))
+                print(f"✅ Executed: {statement[:80]}...")
+            except Exception as e:
+                if 'Duplicate key name' in str(e):
+                    print(f"ℹ️  Index already exists: {statement[:60]}...")
+                else:
+                    print(f"⚠️  Error: {str(e)[:100]}")
+        
+        conn.commit()
+    
+    print("\n✅ Migration completed successfully!")
+    print("\n🔍 Run python check_query_plans.py to verify the hot queries use them")
+    
+except Exception as e:
+    print(f"❌ Error: {e}")
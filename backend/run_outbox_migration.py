@@ -0,0 +1,32 @@
+from app.database import engine
+from sqlalchemy import text
+
+print("🔄 Creating notification outbox table...")
+
+try:
+    with engine.connect() as conn:
+        # Read SQL migration
+        with open('create_notification_outbox.sql', 'r') as f:
+            sql_content = f.read()
+        
+        # Drop comment lines, then split and execute each statement
+        sql_content = "\n".join(line for line in sql_content.splitlines() if not line.strip().startswith('--'))
+        statements = [stmt.strip() + ';' for stmt in sql_content.split(';') if stmt.strip()]
+        
+        for statement in statements:
+            try:
+                conn.execute(text(statement))
+                print(f"✅ Executed: {statement[:80]}...")
+            except Exception as e:
+                if 'already exists' in str(e) or 'Duplicate key name' in str(e):
+                    print(f"ℹ️  Already applied: {statement[:60]}...")
+                else:
+                    print(f"⚠️  Error: {str(e)[:100]}")
+        
+        conn.commit()
+    
+    print("\n✅ Migration completed successfully!")
+    print("\n📬 Notifications are now queued with each change and sent by the outbox worker")
+    
+except Exception as e:
+    print(f"❌ Error: {e}")
@@ -14,7 +14,7 @@ sys.path.insert(0, str(backend_dir))
 
 from app.database import SessionLocal, init_db
 from app.models.user import User
-from app.auth import get_password_hash
+from app.services.password_service import hash_passwords, shutdown_password_pool
 
 def update_passwords():
     """Update all user passwords with new hash"""
@@ -36,14 +36,13 @@ def update_passwords():
         
         print(f"Found {len(users)} users to update")
         
+        # Set password to 'password123' for all users, hashing in parallel
+        new_password_hashes = hash_passwords(["password123"] * len(users))
+        
         # Update each user's password
-        for user in users:
+        for user, new_password_hash in zip(users, new_password_hashes):
             print(f"Updating password for: {user.email}")
-            
-            # Set password to 'password123' for all users
-            new_password_hash = get_password_hash("password123")
             user.password_hash = new_password_hash
-            
             print(f"✅ Updated {user.email}")
         
         # Commit changes
@@ -56,6 +55,7 @@ def update_passwords():
         db.rollback()
     finally:
         db.close()
+        shutdown_password_pool()
 
 if __name__ == "__main__":
     update_passwords()
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react'
 import { api } from '../services/api'
+import { onConnected, subscribe } from '../services/events'
 import { BellIcon } from '@heroicons/react/24/outline'
 import { BellIcon as BellIconSolid } from '@heroicons/react/24/solid'
 import { useNavigate } from 'react-router-dom'
@@ -15,17 +16,27 @@ export default function NotificationBell() {
     fetchUnreadCount()
     fetchNotifications()
     
-    // Poll for new notifications every 30 seconds
-    const interval = setInterval(() => {
-      fetchUnreadCount()
+    // New notifications are pushed over the event stream instead of polled
+    return subscribe('notification.created', () => {
+      setUnreadCount((count) => count + 1)
       if (showDropdown) {
         fetchNotifications()
       }
-    }, 30000)
-    
-    return () => clearInterval(interval)
+    })
   }, [showDropdown])
 
+  useEffect(() => {
+    // Catch up after the event stream reconnects, and poll slowly as a
+    // fallback for while it is down
+    const unsubscribe = onConnected(fetchUnreadCount)
+    const interval = setInterval(fetchUnreadCount, 120000)
+
+    return () => {
+      unsubscribe()
+      clearInterval(interval)
+    }
+  }, [])
+
   const fetchUnreadCount = async () => {
     try {
       const response = await api.get('/notifications/unread-count')
@@ -1,7 +1,8 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { DragDropContext, Droppable, Draggable } from 'react-beautiful-dnd'
 import { api } from '../services/api'
+import { onConnected, subscribe } from '../services/events'
 import { useAuth } from '../contexts/AuthContext'
 import toast from 'react-hot-toast'
 
@@ -89,9 +90,56 @@ export default function Board() {
     }
   }, [filter])
 
-  const fetchItems = async () => {
+  // Apply item changes pushed from elsewhere to the board directly; a full
+  // refetch only happens after the event stream reconnects
+  const changeSeqs = useRef(new Map())
+
+  useEffect(() => {
+    const matchesFilter = (item) => {
+      // Same scoping and filters the server applies to GET /items
+      if (user?.role === 'dev' && filter.assignee !== 'me' && user.branch_id != null && item.branch_id !== user.branch_id) return false
+      if (filter.branch && item.branch_id !== parseInt(filter.branch)) return false
+      if (filter.type && item.type !== filter.type) return false
+      if (filter.assignee === 'me') return item.assignee_id === user?.id
+      if (filter.assignee && !isNaN(parseInt(filter.assignee))) return item.assignee_id === parseInt(filter.assignee)
+      return true
+    }
+    const isStale = (id, changeSeq) => {
+      // Events from different workers can arrive out of order
+      if (changeSeq < (changeSeqs.current.get(id) ?? 0)) return true
+      changeSeqs.current.set(id, changeSeq)
+      return false
+    }
+    const applyItem = ({ item, change_seq }) => {
+      if (isStale(item.id, change_seq)) return
+      setItems((prevItems) => {
+        const others = prevItems.filter((existing) => existing.id !== item.id)
+        if (!matchesFilter(item)) return others.length === prevItems.length ? prevItems : others
+        if (others.length === prevItems.length) return [...prevItems, item].sort((a, b) => a.id - b.id)
+        return prevItems.map((existing) => (existing.id === item.id ? item : existing))
+      })
+    }
+    const removeItem = ({ id, change_seq }) => {
+      if (isStale(id, change_seq)) return
+      setItems((prevItems) => prevItems.filter((item) => item.id !== id))
+    }
+
+    let connected = false
+    const unsubscribers = [
+      ...['item.created', 'item.updated', 'item.assigned'].map((type) => subscribe(type, applyItem)),
+      subscribe('item.removed', removeItem),
+      onConnected(() => {
+        // Changes pushed while the stream was down were missed
+        if (connected) fetchItems({ silent: true })
+        connected = true
+      })
+    ]
+    return () => unsubscribers.forEach((unsubscribe) => unsubscribe())
+  }, [filter, user?.id, user?.role, user?.branch_id])
+
+  const fetchItems = async ({ silent = false } = {}) => {
     try {
-      setLoading(true)
+      if (!silent) setLoading(true)
       const params = new URLSearchParams()
       params.append('limit', '10000')
       if (filter.type) params.append('type', filter.type)
@@ -187,98 +235,28 @@ export default function Board() {
   const exportToExcel = async () => {
     try {
       toast('⏳ Preparing export with comments...')
-      
-      // Fetch comments for all tickets
-      const ticketsWithComments = await Promise.all(
-        items.map(async (item) => {
-          try {
-            const response = await api.get(`/items/${item.id}/comments`)
-            return { ...item, comments: response.data }
-          } catch (error) {
-            return { ...item, comments: [] }
-          }
-        })
-      )
-      
+
+      // One streamed file from the server: a row per ticket and comment,
+      // with the same filters as the board
+      const params = new URLSearchParams()
+      params.append('format', 'xlsx')
+      if (filter.type) params.append('type', filter.type)
+      if (filter.assignee) params.append('assignee_id', filter.assignee)
+      if (filter.branch) params.append('branch_id', filter.branch)
+      const response = await api.get(`/items/export?${params.toString()}`, { responseType: 'blob', timeout: 0 })
+
       const dateStr = new Date().toISOString().split('T')[0]
-      
-      // File 1: Tickets Export
-      const ticketHeaders = ['ID', 'Title', 'Type', 'Priority', 'Status', 'Assignee', 'Reporter', 'Branch', 'Start Date', 'Due Date', 'Completed Date', 'Created', 'Updated', 'SLA Hours', 'Description']
-      const ticketRows = ticketsWithComments.map(item => [
-        item.id,
-        item.title,
-        item.type,
-        item.priority,
-        item.status,
-        item.assignee_id ? (users.find(u => u.id === item.assignee_id)?.name || `User ${item.assignee_id}`) : 'Unassigned',
-        users.find(u => u.id === item.reporter_id)?.name || `User ${item.reporter_id}`,
-        item.branch_id || 'N/A',
-        item.start_date ? new Date(item.start_date).toLocaleString() : 'Not set',
-        item.end_date ? new Date(item.end_date).toLocaleString() : 'Not set',
-        item.completed_at ? new Date(item.completed_at).toLocaleString() : 'Not completed',
-        new Date(item.created_at).toLocaleString(),
-        new Date(item.updated_at).toLocaleString(),
-        item.sla_hours || 'N/A',
-        item.description || 'No description'
-      ])
-      
-      const ticketCSV = [
-        ticketHeaders.join(','),
-        ...ticketRows.map(row => row.map(cell => `"${String(cell).replace(/"/g, '""')}"`).join(','))
-      ].join('\n')
-      
-      // Download Tickets file
-      const ticketBlob = new Blob([ticketCSV], { type: 'text/csv;charset=utf-8;' })
-      const ticketLink = document.createElement('a')
-      const ticketUrl = URL.createObjectURL(ticketBlob)
-      ticketLink.setAttribute('href', ticketUrl)
-      ticketLink.setAttribute('download', `tickets_${dateStr}.csv`)
-      ticketLink.style.visibility = 'hidden'
-      document.body.appendChild(ticketLink)
-      ticketLink.click()
-      document.body.removeChild(ticketLink)
-      
-      // File 2: Comment Logs Export
-      const commentHeaders = ['Ticket ID', 'Ticket Title', 'Status', 'Priority', 'Comment Date', 'User', 'Comment Text', 'Comment Type']
-      const commentRows = []
-      ticketsWithComments.forEach(item => {
-        if (item.comments && item.comments.length > 0) {
-          item.comments.forEach(comment => {
-            const isSystemComment = comment.body.includes('Status changed') || comment.body.includes('REOPENED') || comment.body.includes('assigned')
-            commentRows.push([
-              item.id,
-              item.title,
-              item.status,
-              item.priority,
-              new Date(comment.created_at).toLocaleString(),
-              users.find(u => u.id === comment.user_id)?.name || `User ${comment.user_id}`,
-              comment.body.replace(/"/g, '""'),
-              isSystemComment ? 'System' : 'User'
-            ])
-          })
-        }
-      })
-      
-      const commentCSV = [
-        commentHeaders.join(','),
-        ...commentRows.map(row => row.map(cell => `"${String(cell).replace(/"/g, '""')}"`).join(','))
-      ].join('\n')
-      
-      // Download Comments file (slight delay to avoid browser blocking)
-      setTimeout(() => {
-        const commentBlob = new Blob([commentCSV], { type: 'text/csv;charset=utf-8;' })
-        const commentLink = document.createElement('a')
-        const commentUrl = URL.createObjectURL(commentBlob)
-        commentLink.setAttribute('href', commentUrl)
-        commentLink.setAttribute('download', `ticket_comments_${dateStr}.csv`)
-        commentLink.style.visibility = 'hidden'
-        document.body.appendChild(commentLink)
-        commentLink.click()
-        document.body.removeChild(commentLink)
-        
-        toast.success(`✅ Downloaded 2 files: ${items.length} tickets + ${commentRows.length} comments!`)
-      }, 500)
-      
+      const link = document.createElement('a')
+      const url = URL.createObjectURL(response.data)
+      link.setAttribute('href', url)
+      link.setAttribute('download', `tickets_${dateStr}.xlsx`)
+      link.style.visibility = 'hidden'
+      document.body.appendChild(link)
+      link.click()
+      document.body.removeChild(link)
+      URL.revokeObjectURL(url)
+
+      toast.success('✅ Export downloaded!')
     } catch (error) {
       console.error('Export failed:', error)
       toast.error('Failed to export data')
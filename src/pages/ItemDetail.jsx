@@ -14,12 +14,15 @@ import {
 import TimeTracker from '../components/TimeTracker'
 import TimeEntriesList from '../components/TimeEntriesList'
 
+const COMMENTS_PAGE_SIZE = 50
+
 export default function ItemDetail() {
   const { id } = useParams()
   const navigate = useNavigate()
   const { user } = useAuth()
   const [item, setItem] = useState(null)
   const [comments, setComments] = useState([])
+  const [commentsCursor, setCommentsCursor] = useState(null)
   const [users, setUsers] = useState([])
   const [attachments, setAttachments] = useState([])
   const [loading, setLoading] = useState(true)
@@ -58,15 +61,28 @@ export default function ItemDetail() {
     }
   }
 
+  // Reload from the first page, keeping at least as many comments as are already shown
   const fetchComments = async () => {
     try {
-      const response = await api.get(`/items/${id}/comments`)
-      setComments(response.data)
+      const limit = Math.min(Math.max(COMMENTS_PAGE_SIZE, comments.length + 1), 500)
+      const response = await api.get(`/items/${id}/comments?pagination=cursor&limit=${limit}`)
+      setComments(response.data.items)
+      setCommentsCursor(response.data.next_cursor)
     } catch (error) {
       console.error('Failed to fetch comments:', error)
     }
   }
 
+  const loadMoreComments = async () => {
+    try {
+      const response = await api.get(`/items/${id}/comments?limit=${COMMENTS_PAGE_SIZE}&cursor=${encodeURIComponent(commentsCursor)}`)
+      setComments((prev) => [...prev, ...response.data.items])
+      setCommentsCursor(response.data.next_cursor)
+    } catch (error) {
+      console.error('Failed to load more comments:', error)
+    }
+  }
+
   const fetchUsers = async () => {
     try {
       const response = await api.get('/users')
@@ -594,7 +610,7 @@ export default function ItemDetail() {
             <div className="flex items-center gap-2 mb-3">
               <ChatBubbleLeftIcon className="h-4 w-4 text-gray-400" />
               <h2 className="text-sm font-semibold text-gray-900">
-                Comments ({comments.length})
+                Comments ({comments.length}{commentsCursor ? '+' : ''})
               </h2>
             </div>
 
@@ -632,7 +648,7 @@ export default function ItemDetail() {
                     }`}>
                       <div className="flex items-center gap-2 mb-2">
                         <UserCircleIcon className="h-5 w-5 text-gray-600" />
-                        <span className="font-semibold text-gray-900">{getUserName(comment.user_id)}</span>
+                        <span className="font-semibold text-gray-900">{comment.user_name || getUserName(comment.user_id)}</span>
                         <span className="text-xs text-gray-500">
                           {formatRelativeTime(comment.created_at)}
                         </span>
@@ -647,6 +663,11 @@ export default function ItemDetail() {
                   )
                 })
               )}
+              {commentsCursor && (
+                <button onClick={loadMoreComments} className="btn btn-secondary w-full text-sm py-1.5">
+                  Load more comments
+                </button>
+              )}
             </div>
           </div>
         </div>
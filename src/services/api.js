@@ -1,7 +1,7 @@
 import axios from 'axios'
 
 // Use environment variable for production, fallback to '/api' for development
-const API_BASE_URL = import.meta.env.VITE_API_URL || '/api'
+export const API_BASE_URL = import.meta.env.VITE_API_URL || '/api'
 
 export const api = axios.create({
   baseURL: API_BASE_URL,
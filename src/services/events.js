@@ -0,0 +1,89 @@
+import { api, API_BASE_URL } from './api'
+
+// Backoff between reconnect attempts once the browser has given up
+const RECONNECT_DELAYS = [1000, 5000, 15000, 30000]
+
+// One EventSource per tab, shared by every component that subscribes
+let source = null
+let reconnectTimer = null
+let reconnectAttempts = 0
+const listeners = new Map()
+const connectedCallbacks = new Set()
+
+const listenerCount = () =>
+  [...listeners.values()].reduce((count, handlers) => count + handlers.size, 0)
+
+const connect = () => {
+  const token = localStorage.getItem('token')
+  if (!token) return null
+
+  // EventSource cannot send an Authorization header, so pass the token in the URL
+  source = new EventSource(`${API_BASE_URL}/events/stream?token=${encodeURIComponent(token)}`)
+  source.onopen = () => {
+    reconnectAttempts = 0
+    connectedCallbacks.forEach((callback) => callback())
+  }
+  // The browser retries dropped connections by itself, but stops for good on
+  // any non-200 answer (e.g. 401 once the token in the URL has expired)
+  source.onerror = () => {
+    if (source?.readyState === EventSource.CLOSED) scheduleReconnect()
+  }
+  // Sent by the server just before it closes a stream whose token no longer holds
+  source.addEventListener('auth.expired', scheduleReconnect)
+  listeners.forEach((handlers, type) => {
+    handlers.forEach((handler) => source.addEventListener(type, handler))
+  })
+  return source
+}
+
+const scheduleReconnect = () => {
+  source?.close()
+  source = null
+  if (reconnectTimer || listenerCount() === 0) return
+
+  const delay = RECONNECT_DELAYS[Math.min(reconnectAttempts, RECONNECT_DELAYS.length - 1)]
+  reconnectAttempts += 1
+  reconnectTimer = setTimeout(async () => {
+    reconnectTimer = null
+    if (source || listenerCount() === 0) return
+    try {
+      // Confirms the stored token still works before reusing it; on 401 the
+      // api interceptor sends the user to log in again for a fresh one
+      await api.get('/auth/me')
+    } catch (error) {
+      if (error.response?.status !== 401) scheduleReconnect()
+      return
+    }
+    connect()
+  }, delay)
+}
+
+// Called every time the stream (re)connects, so callers can catch up on
+// anything pushed while it was down
+export const onConnected = (callback) => {
+  connectedCallbacks.add(callback)
+  return () => connectedCallbacks.delete(callback)
+}
+
+export const subscribe = (type, callback) => {
+  const handler = (event) => callback(JSON.parse(event.data))
+  if (!listeners.has(type)) listeners.set(type, new Set())
+  listeners.get(type).add(handler)
+
+  if (source) {
+    source.addEventListener(type, handler)
+  } else if (!reconnectTimer) {
+    connect()
+  }
+
+  return () => {
+    listeners.get(type)?.delete(handler)
+    source?.removeEventListener(type, handler)
+    if (listenerCount() === 0) {
+      source?.close()
+      source = null
+      clearTimeout(reconnectTimer)
+      reconnectTimer = null
+    }
+  }
+}